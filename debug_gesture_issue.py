@@ -1,98 +1,240 @@
 #!/usr/bin/env python3
 """
 Debug script to test gesture recognition issue
+
+Usage:
+    python debug_gesture_issue.py [--debug]
+
+Pass --debug to list every gesture with its binding and pattern.
 """
 
 import sys
 import os
 import json
+import logging
+import pathlib
+import hashlib
+import functools
+import importlib.util
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
-# Add current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
-    from gesture_profile_manager import GestureProfileManager
-    
-    def debug_profile_data():
-        """Debug profile data to see what's stored"""
-        print("🔍 Debugging Profile Data...")
-        
-        # Create profile manager
-        manager = GestureProfileManager()
-        
-        # List all profiles
-        profiles = manager.get_profile_names()
-        print(f"📁 Available profiles: {profiles}")
-        
-        for profile_name in profiles:
-            print(f"\n📋 Profile: {profile_name}")
-            
-            # Load profile
-            profile_data = manager.load_profile(profile_name)
-            if profile_data:
-                gestures = profile_data.get('gestures', {})
-                bindings = profile_data.get('bindings', {})
-                active_gestures = profile_data.get('active_gestures', [])
-                
-                print(f"   Total gestures: {len(gestures)}")
-                print(f"   Active gestures: {len(active_gestures)} - {active_gestures}")
-                print(f"   Bindings: {bindings}")
-                
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Raw profiles larger than this are streamed instead of parsed whole
+STREAMING_THRESHOLD = 10 * 1024 * 1024
+
+log = logging.getLogger(__name__)
+
+# Add current directory to Python path
+_HERE = str(pathlib.Path(__file__).parent)
+sys.path.append(_HERE)
+
+# Check required modules up front so a missing one is reported before any work starts
+missing_modules = [name for name in ('numpy', 'gesture_profile_manager', 'gesture_recognition')
+                   if importlib.util.find_spec(name) is None]
+if missing_modules:
+    print(f"❌ Import error: missing {', '.join(missing_modules)}")
+    print("Please ensure all required modules are available")
+    sys.exit(1)
+
+import numpy as np
+from gesture_profile_manager import GestureProfileManager
+from gesture_recognition import GestureRecognitionEngine
+
+@functools.lru_cache(maxsize=32)
+def _load_raw(filepath, mtime_ns):
+    """Parse a profile file, cached per (path, mtime) so unchanged files are parsed once (bounded, old mtimes age out)"""
+    with open(filepath, 'rb') as f:
+        raw_bytes = f.read()
+    return orjson.loads(raw_bytes) if ORJSON_AVAILABLE else json.loads(raw_bytes)
+
+@functools.lru_cache(maxsize=32)
+def _stream_raw_summary(filepath, mtime_ns):
+    """Stream a large profile file, keeping only what the report needs"""
+    summary = {'active_gestures': [], 'gesture_count': 0, 'binding_count': 0}
+    with open(filepath, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'active_gestures.item':
+                summary['active_gestures'].append(value)
+            elif event == 'map_key' and prefix == 'gestures':
+                summary['gesture_count'] += 1
+            elif event == 'map_key' and prefix == 'bindings':
+                summary['binding_count'] += 1
+    return summary
+
+def _summarize_raw(filepath):
+    """Summarize a raw profile file: active gestures plus gesture and binding counts"""
+    file_stat = os.stat(filepath)
+    if IJSON_AVAILABLE and file_stat.st_size > STREAMING_THRESHOLD:
+        return _stream_raw_summary(filepath, file_stat.st_mtime_ns)
+
+    return _summarize_data(_load_raw(filepath, file_stat.st_mtime_ns))
+
+def _summarize_data(profile_data):
+    """Summarize parsed profile data the same way as a raw file"""
+    return {
+        'active_gestures': profile_data.get('active_gestures', []),
+        'gesture_count': len(profile_data.get('gestures', {})),
+        'binding_count': len(profile_data.get('bindings', {}))
+    }
+
+# Fixed test data for test_gesture_matching, built once at import
+_TEST_GESTURES = MappingProxyType({
+    'test1': {'pattern': [1, 0, 0, 0, 0], 'hand_type': 'single'},
+    'test2': {'pattern': [0, 1, 0, 0, 0], 'hand_type': 'single'},
+    'test3': {'pattern': [0, 0, 1, 0, 0], 'hand_type': 'single'}
+})
+_TEST_ACTIVE_GESTURES = frozenset(_TEST_GESTURES)
+
+def _hash_raw_profile(filepath):
+    """Digest a raw profile file in chunks, returning (digest, error) instead of raising"""
+    try:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.digest(), None
+    except Exception as e:
+        return None, e
+
+def _read_raw_profile(filepath):
+    """Summarize one raw profile file, returning (summary, error) instead of raising"""
+    try:
+        return _summarize_raw(filepath), None
+    except Exception as e:
+        return None, e
+
+@functools.lru_cache(maxsize=1)
+def _get_manager():
+    """Build the profile manager once and reuse it across debug runs"""
+    return GestureProfileManager()
+
+@functools.lru_cache(maxsize=1)
+def _get_engine():
+    """Build the recognition engine once and reuse it across debug runs"""
+    return GestureRecognitionEngine()
+
+def debug_profile_data():
+    """Debug profile data to see what's stored"""
+    sys.stdout.write("🔍 Debugging Profile Data...\n")
+
+    # Shared profile manager
+    manager = _get_manager()
+
+    # List all profiles
+    profiles = manager.get_profile_names()
+    sys.stdout.write(f"📁 Available profiles: {profiles}\n")
+
+    # Hash the raw files concurrently up front; the report itself stays in order
+    filepaths = [manager.profiles[name].filepath for name in profiles]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        raw_digests = dict(zip(profiles, executor.map(_hash_raw_profile, filepaths)))
+
+    for profile_name in profiles:
+        sys.stdout.write(f"\n📋 Profile: {profile_name}\n")
+
+        # Collect the report and write it in one go once the profile is loaded
+        out = []
+
+        # Load profile
+        profile_data = manager.load_profile(profile_name)
+        if profile_data:
+            gestures = profile_data.get('gestures', {})
+            bindings = profile_data.get('bindings', {})
+            active_gestures = profile_data.get('active_gestures', [])
+            active_set = manager.get_active_gestures(profile_name)
+
+            out.append(f"   Total gestures: {len(gestures)}")
+            out.append(f"   Active gestures: {len(active_gestures)} - {active_gestures}")
+            out.append(f"   Bindings: {bindings}")
+
+            # Per-gesture detail is only built when debug output is enabled
+            if log.isEnabledFor(logging.DEBUG):
+                # Build the gesture table once as parallel columns
+                names = list(gestures)
+                gesture_rows = list(gestures.values())
+                patterns = [gesture_data.get('pattern', []) for gesture_data in gesture_rows]
+                hand_types = [gesture_data.get('hand_type', 'single') for gesture_data in gesture_rows]
+                key_bindings = [bindings.get(name, "No binding") for name in names]
+                active_flags = [name in active_set for name in names]
+
                 # Check each gesture
-                for gesture_name, gesture_data in gestures.items():
-                    is_active = gesture_name in active_gestures
-                    key_binding = bindings.get(gesture_name, "No binding")
-                    pattern = gesture_data.get('pattern', [])
-                    
-                    print(f"     • {gesture_name}: {key_binding} - {'✅ Active' if is_active else '❌ Inactive'} - Pattern: {pattern}")
-                
-                # Also check the raw file
-                print(f"\n📄 Raw file content for {profile_name}:")
-                try:
-                    filepath = manager.profiles[profile_name]['filepath']
-                    with open(filepath, 'r') as f:
-                        raw_data = json.load(f)
-                    
-                    print(f"   File active_gestures: {raw_data.get('active_gestures', [])}")
-                    print(f"   File gestures count: {len(raw_data.get('gestures', {}))}")
-                    print(f"   File bindings count: {len(raw_data.get('bindings', {}))}")
-                    
-                except Exception as e:
-                    print(f"   Error reading file: {e}")
+                out.append("   Single-hand patterns: bent-inward bits | extended bits, thumb is the lowest bit")
+                for i, gesture_name in enumerate(names):
+                    if hand_types[i] == 'single':
+                        pattern_text = f"{GestureRecognitionEngine.pack_pattern(patterns[i]):010b}"
+                    else:
+                        pattern_text = str(patterns[i])
+                    out.append(f"     • {gesture_name}: {key_bindings[i]} - {'✅ Active' if active_flags[i] else '❌ Inactive'} - Pattern: {pattern_text}")
+
+            # Also check the raw file
+            out.append(f"\n📄 Raw file content for {profile_name}:")
+            raw_digest, error = raw_digests[profile_name]
+            if error is None and raw_digest == manager.profiles[profile_name].digest:
+                # File is byte-for-byte what load_profile parsed, so report from the loaded data
+                raw_summary = _summarize_data(profile_data)
             else:
-                print(f"   ❌ Could not load profile data")
-    
-    def test_gesture_matching():
-        """Test gesture matching logic"""
-        print("\n🧪 Testing Gesture Matching...")
-        
-        from gesture_recognition import GestureRecognitionEngine
-        
-        engine = GestureRecognitionEngine()
-        
-        # Create test data
-        custom_gestures = {
-            'test1': {'pattern': [1, 0, 0, 0, 0], 'hand_type': 'single'},
-            'test2': {'pattern': [0, 1, 0, 0, 0], 'hand_type': 'single'},
-            'test3': {'pattern': [0, 0, 1, 0, 0], 'hand_type': 'single'}
-        }
-        
-        active_gestures = {'test1', 'test2', 'test3'}
-        
-        # Test pattern that should match test1
-        test_pattern = [1, 0, 0, 0, 0]
-        
-        result = engine.match_custom_gesture(test_pattern, custom_gestures, active_gestures)
-        
-        print(f"Test pattern: {test_pattern}")
-        print(f"Custom gestures: {list(custom_gestures.keys())}")
-        print(f"Active gestures: {list(active_gestures)}")
-        print(f"Match result: {result}")
-    
-    if __name__ == "__main__":
-        debug_profile_data()
-        test_gesture_matching()
-
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-    print("Please ensure all required modules are available")
+                raw_summary, error = _read_raw_profile(manager.profiles[profile_name].filepath)
+
+            if error is None:
+                out.append(f"   File active_gestures: {raw_summary['active_gestures']}")
+                out.append(f"   File gestures count: {raw_summary['gesture_count']}")
+                out.append(f"   File bindings count: {raw_summary['binding_count']}")
+            else:
+                out.append(f"   Error reading file: {error}")
+        else:
+            out.append(f"   ❌ Could not load profile data")
+
+        sys.stdout.write("\n".join(out) + "\n")
+
+def test_gesture_matching():
+    """Test gesture matching logic"""
+    sys.stdout.write("\n🧪 Testing Gesture Matching...\n")
+
+    engine = _get_engine()
+
+    # Shared test data
+    custom_gestures = _TEST_GESTURES
+    active_gestures = _TEST_ACTIVE_GESTURES
+
+    # Test pattern that should match test1
+    test_pattern = [1, 0, 0, 0, 0]
+
+    result = engine.match_custom_gesture(test_pattern, custom_gestures, active_gestures)
+
+    # Cross-check with a single vectorized exact-match over every stored pattern
+    names = list(custom_gestures.keys())
+    pattern_matrix = np.array([g['pattern'] for g in custom_gestures.values()], dtype=np.int8)
+    active_mask = np.array([name in active_gestures for name in names])
+    hits = np.flatnonzero((pattern_matrix == np.array(test_pattern, dtype=np.int8)).all(axis=1) & active_mask)
+
+    # Same check on bit-packed patterns: one int compare per gesture
+    packed = {name: engine.pack_pattern(g['pattern']) for name, g in custom_gestures.items()}
+    packed_query = engine.pack_pattern(test_pattern)
+    packed_hits = [name for name, p in packed.items() if p == packed_query and name in active_gestures]
+
+    out = [
+        f"Test pattern: {test_pattern}",
+        f"Custom gestures: {names}",
+        f"Active gestures: {list(active_gestures)}",
+        f"Match result: {result}",
+        f"Exact pattern hits: {[names[i] for i in hits]}",
+        f"Packed pattern hits: {packed_hits} (query {packed_query})",
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if '--debug' in sys.argv else logging.WARNING)
+    debug_profile_data()
+    test_gesture_matching()
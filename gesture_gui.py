@@ -4,10 +4,69 @@ Gesture GUI Components
 Handles the graphical user interface for gesture management
 """
 
+import copy
+import platform
+import threading
+import weakref
+from functools import partial
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+import tkinter.font as tkfont
+from tkinter import ttk
+from tkinter.messagebox import showinfo, showerror, showwarning, askyesno, askyesnocancel
+from tkinter.simpledialog import askstring
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 
+# Fixed height of one row in the profile selector list (pixels)
+PROFILE_ROW_HEIGHT = 90
+
+# Most profile names shown in the dropdown at once; typing narrows the list
+PROFILE_DROPDOWN_LIMIT = 50
+
+# Gesture list refreshes inserting more rows than this hide the columns while inserting
+BULK_INSERT_THRESHOLD = 20
+
+# How long the settings window notification bar (and its Undo button) stays up (milliseconds)
+NOTIFICATION_DURATION_MS = 5000
+
+# Gesture edits made within this long of each other are written to disk together (milliseconds)
+SAVE_DEBOUNCE_MS = 500
+
+# How often the Tk thread checks for finished profile file I/O (milliseconds)
+IO_POLL_INTERVAL_MS = 50
+
+# How often the Tk thread checks whether the recorder has finished (milliseconds)
+RECORDING_POLL_INTERVAL_MS = 100
+
+# Gesture list text for each hand type; anything that is not 'both' shows as single
+HAND_TYPE_DISPLAY = {'both': "👥 Both", 'single': "👤 Single"}
+
+# Label colors registered once as named ttk styles ('Blue.TLabel', ...) instead of per-widget foreground=
+LABEL_STYLE_COLORS = (('Blue', 'blue'), ('DarkBlue', 'darkblue'), ('Gray', 'gray'),
+                      ('Green', 'green'), ('Orange', 'orange'))
+
+# Shared Arial fonts by (size, bold), created on first use and reused by every widget
+_FONTS = {}
+
+
+def _font(size, bold=False):
+    """Get the shared Arial font object for a size and weight"""
+    key = (size, bold)
+    if key not in _FONTS:
+        _FONTS[key] = tkfont.Font(family='Arial', size=size, weight='bold' if bold else 'normal')
+    return _FONTS[key]
+
+
+# Tk on Windows renders emoji through a slow per-redraw font fallback, so buttons use plain text there
+PLAIN_BUTTON_TEXT = platform.system() == 'Windows'
+
+
+def _button_text(text):
+    """Get a button label, dropping the leading emoji when plain button text is in use"""
+    if PLAIN_BUTTON_TEXT:
+        return text.split(' ', 1)[-1]
+    return text
+
 
 class GestureSettingsGUI:
     """Main settings GUI for gesture management"""
@@ -22,20 +81,197 @@ class GestureSettingsGUI:
         self.settings_open = False
         
         # UI Components
-        self.profile_listbox = None
+        self.profile_dropdown = None
+        self.profile_var = None
         self.gesture_tree = None
         self.current_profile_label = None
-        self.selected_profile_label = None
-        self.manage_profile_label = None
         self.gesture_name_entry = None
         self.key_binding_entry = None
         self.hand_type_var = None
         self.recording_status_label = None
+        self.status_label = None
         self.record_button = None
+        self.key_conflict_label = None
+        self.current_profile_var = None
+        self.status_var = None
+
+        # Widgets that are still alive; entries are dropped on <Destroy>
+        self._live = weakref.WeakSet()
+
+        # Profile snapshots, filled lazily and cleared when profiles are created, deleted or loaded
+        self._profile_names_cache = None
+        self._current_profile_data_cache = None
+
+        # Profile selector list state; only rows in view have widgets
+        self._profile_list_canvas = None
+        self._profile_list_names = []
+        self._profile_list_selector = None
+        self._profile_row_pool = []
+        self._profile_info_cache = {}
+        self._selector_current_label = None
+
+        # Profiles with gesture edits not yet written to disk, and the timer that will write them
+        self._dirty_profiles = set()
+        self._save_after_id = None
+
+        # Notification bar along the bottom of the settings window, built on first use
+        self._notification_bar = None
+        self._notification_label = None
+        self._notification_undo_button = None
+        self._notification_undo = None
+        self._notification_after_id = None
+
+        # Last values shown per gesture tree row (the row iid is the gesture name),
+        # so refreshes only touch rows that changed
+        self._tree_owner = None
+        self._tree_state = {}
+
+        # Settings window Step 2 / Step 3 containers, filled in lazily
+        self._step2_frame = None
+        self._step3_frame = None
+        self._profile_steps_built = False
+
+        # Parts of the window waiting for the next coalesced idle refresh
+        # ('profile', 'gestures')
+        self._refresh_pending = set()
+
+        # Profile file I/O runs here, one job at a time, off the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
         
+        # Set by the recorder thread when a recording ends, successfully or not
+        self._recording_finished = threading.Event()
+
+        # Newest recording status not yet shown, and the idle callback that will show it
+        self._pending_status = None
+        self._status_after_id = None
+
+        # True from the moment a recording is started until its GUI reset has run
+        self._recording_in_progress = False
+
+        # Named label styles are registered with Tk the first time a window is built
+        self._label_styles_configured = False
+
         # Set up recorder callbacks
         self.gesture_recorder.set_status_callback(self.update_recording_status)
+        self.gesture_recorder.set_completion_callback(self._on_recording_done)
     
+    def _get_profile_names_cached(self):
+        """Get profile names, reusing the last snapshot until profiles change"""
+        if self._profile_names_cache is None:
+            self._profile_names_cache = self.profile_manager.get_profile_names()
+        return self._profile_names_cache
+
+    def _get_current_profile_data_cached(self):
+        """Get current profile data, reusing the last snapshot while the same profile is loaded"""
+        current_profile = self.profile_manager.current_profile
+        if self._current_profile_data_cache is None or self._current_profile_data_cache[0] != current_profile:
+            self._current_profile_data_cache = (current_profile, self.profile_manager.get_current_profile_data())
+        return self._current_profile_data_cache[1]
+
+    def _invalidate_profile_cache(self):
+        """Drop cached profile snapshots after a profile is created, deleted or loaded"""
+        self._profile_names_cache = None
+        self._current_profile_data_cache = None
+        self._profile_info_cache = {}
+
+    def _schedule_refresh(self, *parts):
+        """Schedule one combined refresh for the next idle pass (no parts means the whole profile view)"""
+        already_scheduled = bool(self._refresh_pending)
+        self._refresh_pending.update(parts or ('profile',))
+        if already_scheduled:
+            return
+
+        window = self.settings_window or self.root
+        if not window:
+            self._do_refresh()
+            return
+
+        window.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        """Run every refresh requested since the last idle pass, each one once"""
+        parts, self._refresh_pending = self._refresh_pending, set()
+        try:
+            if 'profile' in parts:
+                if self.settings_window and self._step2_frame is not None:
+                    self._build_profile_steps()
+                self.refresh_profile_dropdown()
+                self.update_profile_labels()  # status follows through the current profile trace
+            if parts & {'profile', 'gestures'}:
+                self.refresh_gesture_list()
+            if 'profile' in parts:
+                self._validate_key_binding()
+        except tk.TclError:
+            # Settings window was closed before the refresh ran
+            pass
+
+    def _run_profile_io(self, func, args, on_done):
+        """Run profile file I/O on the worker thread, then call on_done(result, error) on the Tk thread"""
+        future = self._io_pool.submit(func, *args)
+
+        # Poll from the Tk thread; the app pumps Tk with update() rather than mainloop,
+        # so the worker must not call into Tk itself
+        window = self.root or self.settings_window
+        if window:
+            window.after(IO_POLL_INTERVAL_MS, self._poll_profile_io, window, future, on_done)
+        else:
+            self._poll_profile_io(None, future, on_done, wait=True)
+
+    def _save_profile_snapshot(self, profile_name, profile_data, on_done):
+        """Save a deep copy of profile data on the I/O worker, so Tk thread edits cannot change it mid-write"""
+        snapshot = copy.deepcopy(profile_data)
+        self._run_profile_io(partial(self.profile_manager.save_profile, snapshot=True),
+                             (profile_name, snapshot), on_done)
+
+    def _poll_profile_io(self, window, future, on_done, wait=False):
+        """Hand a finished I/O result to its callback, or check again shortly"""
+        if not wait and not future.done():
+            window.after(IO_POLL_INTERVAL_MS, self._poll_profile_io, window, future, on_done)
+            return
+
+        try:
+            result, error = future.result(), None
+        except Exception as e:
+            print(f"❌ Profile I/O error: {e}")
+            result, error = None, e
+
+        on_done(result, error)
+
+    def _load_and_activate_profile(self, profile_name):
+        """Load a profile and save it with all gestures active (runs on the I/O thread)"""
+        profile_data = self.profile_manager.load_profile(profile_name)
+        if profile_data:
+            gestures = profile_data.get('gestures', {})
+            profile_data['active_gestures'] = list(gestures.keys())
+            self.profile_manager.save_profile(profile_name, profile_data)
+        return profile_data
+
+    def _on_recording_done(self, gesture_name, gesture_data):
+        """Recorder completion callback (recorder thread): save the gesture, then flag the GUI"""
+        # The recording session persists recorded gestures; keep it in the chain
+        if self.recording_session:
+            self.recording_session.on_gesture_recorded(gesture_name, gesture_data)
+        self._recording_finished.set()
+
+    def _watch_recording(self, window, on_complete):
+        """Run on_complete on the Tk thread as soon as the recorder reports it has finished"""
+        # Statuses posted from recorder threads are shown from here, on the Tk thread
+        self._apply_pending_status()
+        if self._recording_finished.is_set():
+            on_complete()
+        else:
+            window.after(RECORDING_POLL_INTERVAL_MS, self._watch_recording, window, on_complete)
+
+    def _configure_label_styles(self):
+        """Register the colored label styles once"""
+        if self._label_styles_configured:
+            return
+
+        style = ttk.Style()
+        for name, color in LABEL_STYLE_COLORS:
+            style.configure(f'{name}.TLabel', foreground=color)
+        self._label_styles_configured = True
+
     def initialize_root(self):
         """Initialize tkinter root if not exists"""
         if not self.root:
@@ -60,15 +296,18 @@ class GestureSettingsGUI:
             self.settings_window.title("🎮 Enhanced Gesture Settings")
             self.settings_window.geometry("900x700")
             self.settings_window.protocol("WM_DELETE_WINDOW", self.close_settings_window)
-            self.root.update()
+            self.settings_window.update_idletasks()
+            self._configure_label_styles()
         except Exception as e:
             print(f"❌ Error opening settings window: {e}")
             self.settings_open = False
             return
 
-        # Create main container
-        main_frame = ttk.Frame(self.settings_window)
+        # Create main container at a fixed size so adding each child does not
+        # ask for a new size and relayout the window (the window geometry is fixed anyway)
+        main_frame = ttk.Frame(self.settings_window, width=880, height=680)
         main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        main_frame.pack_propagate(False)
 
         # Create the simplified interface
         self.create_simplified_interface(main_frame)
@@ -77,7 +316,7 @@ class GestureSettingsGUI:
         """Create simplified, user-friendly interface"""
         # Title
         title_label = ttk.Label(parent, text="🎮 Gesture Profile Manager",
-                               font=('Arial', 18, 'bold'))
+                               font=_font(18, bold=True))
         title_label.pack(pady=(0, 20))
 
         # Step 1: Profile Selection/Creation
@@ -89,11 +328,13 @@ class GestureSettingsGUI:
         current_frame.pack(fill='x', pady=(0, 10))
 
         ttk.Label(current_frame, text="Current Profile:",
-                 font=('Arial', 12, 'bold')).pack(side='left')
+                 font=_font(12, bold=True)).pack(side='left')
 
         current_profile_name = self.profile_manager.current_profile or "None Selected"
-        self.current_profile_label = ttk.Label(current_frame, text=current_profile_name,
-                                              font=('Arial', 12), foreground='blue')
+        self.current_profile_var = tk.StringVar(value=current_profile_name)
+        self.current_profile_var.trace_add('write', self._on_current_profile_changed)
+        self.current_profile_label = ttk.Label(current_frame, textvariable=self.current_profile_var,
+                                              font=_font(12), style='Blue.TLabel')
         self.current_profile_label.pack(side='left', padx=(10, 0))
 
         # Profile selection and creation
@@ -104,26 +345,65 @@ class GestureSettingsGUI:
         ttk.Label(profile_controls, text="Select Profile:").pack(side='left')
         self.profile_var = tk.StringVar()
         self.profile_dropdown = ttk.Combobox(profile_controls, textvariable=self.profile_var,
-                                           state='readonly', width=20)
+                                           width=20)
         self.profile_dropdown.pack(side='left', padx=(5, 10))
         self.profile_dropdown.bind('<<ComboboxSelected>>', self.on_profile_selected)
+        self.profile_dropdown.bind('<KeyRelease>', self._filter_dropdown)
 
         # Profile buttons
-        ttk.Button(profile_controls, text="📂 New Profile",
+        ttk.Button(profile_controls, text=_button_text("📂 New Profile"),
                   command=self.create_new_profile_simple).pack(side='left', padx=2)
 
-        ttk.Button(profile_controls, text="🏎️ Racing",
+        ttk.Button(profile_controls, text=_button_text("🏎️ Racing"),
                   command=lambda: self.create_template_profile_simple("Racing Game")).pack(side='left', padx=2)
 
-        ttk.Button(profile_controls, text="🎥 Video",
+        ttk.Button(profile_controls, text=_button_text("🎥 Video"),
                   command=lambda: self.create_template_profile_simple("Video Player")).pack(side='left', padx=2)
 
-        ttk.Button(profile_controls, text="🎮 Gaming",
+        ttk.Button(profile_controls, text=_button_text("🎮 Gaming"),
                   command=lambda: self.create_template_profile_simple("General Gaming")).pack(side='left', padx=2)
 
+        # Step 2 and Step 3 are built the first time a profile is selected
+        self._step2_frame = ttk.Frame(parent)
+        self._step2_frame.pack(fill='both', expand=True, pady=(0, 15))
+        self._step3_frame = ttk.Frame(parent)
+        self._step3_frame.pack(fill='x')
+        self._profile_steps_built = False
+
+        # Widgets from a previously opened settings window are gone
+        self.gesture_tree = None
+        self.status_label = None
+        self.record_button = None
+        self.recording_status_label = None
+        self.key_conflict_label = None
+
+        ttk.Label(self._step2_frame, text="Select or create a profile above to start adding gestures",
+                 font=_font(11), style='Gray.TLabel').pack(pady=20)
+
+        # Initialize
+        self.refresh_profile_dropdown()
+        self._build_profile_steps()
+        self.refresh_gesture_list()
+        self.update_status()
+
+    def _build_profile_steps(self):
+        """Build Step 2 and Step 3 once, as soon as there is a current profile"""
+        if self._profile_steps_built or not self.profile_manager.current_profile:
+            return
+        self._profile_steps_built = True
+
+        # Replace the placeholder hint
+        for widget in self._step2_frame.winfo_children():
+            widget.destroy()
+
+        self._build_step2(self._step2_frame)
+        self._build_step3(self._step3_frame)
+
+    def _build_step2(self, parent):
+        """Build Step 2: the add-gesture form, gesture list and profile buttons"""
         # Step 2: Add Gestures
         gesture_section = ttk.LabelFrame(parent, text="Step 2: Add Gestures to Profile", padding=15)
-        gesture_section.pack(fill='both', expand=True, pady=(0, 15))
+        gesture_section.pack(fill='both', expand=True)
 
         # Instructions
         instructions = ttk.Label(gesture_section,
@@ -131,13 +411,13 @@ class GestureSettingsGUI:
                                     "• Single: Use one hand only\n"
                                     "• Both: Use both hands together (great for numbers 6-10)\n"
                                     "• Multiple gestures can use the same key binding",
-                               font=('Arial', 10), foreground='darkblue')
+                               font=_font(10), style='DarkBlue.TLabel')
         instructions.pack(pady=(0, 10))
 
         # Key binding help
         key_help = ttk.Label(gesture_section,
                            text="Key Examples: 'a', 'space', 'enter', 'shift', 'ctrl+c', 'alt+tab', 'f1', 'up', 'down'",
-                           font=('Arial', 9), foreground='gray')
+                           font=_font(9), style='Gray.TLabel')
         key_help.pack(pady=(0, 5))
 
         # Add gesture form
@@ -159,21 +439,29 @@ class GestureSettingsGUI:
                                  values=["single", "both"], state="readonly", width=8)
         hand_combo.grid(row=0, column=5, padx=(0, 10))
 
-        self.record_button = ttk.Button(add_frame, text="🔴 Record Gesture",
+        self.record_button = ttk.Button(add_frame, text=_button_text("🔴 Record Gesture"),
                                        command=self.record_gesture_simple)
         self.record_button.grid(row=0, column=6, padx=(0, 10))
+        self._track_live(self.record_button)
+
+        # Live key binding check, shown inline instead of a dialog at record time
+        self.key_conflict_label = ttk.Label(add_frame, text="", font=_font(9), style='Orange.TLabel')
+        self.key_conflict_label.grid(row=1, column=0, columnspan=7, sticky='w', pady=(5, 0))
+        self.key_binding_entry.bind('<KeyRelease>', self._validate_key_binding)
+        self.gesture_name_entry.bind('<KeyRelease>', self._validate_key_binding)
 
         # Recording status
         self.recording_status_label = ttk.Label(gesture_section,
                                                text="Ready to record gesture",
-                                               font=('Arial', 11))
+                                               font=_font(11))
         self.recording_status_label.pack(pady=5)
+        self._track_live(self.recording_status_label)
 
         # Gesture list
         list_frame = ttk.Frame(gesture_section)
         list_frame.pack(fill='both', expand=True, pady=(10, 0))
 
-        ttk.Label(list_frame, text="Gestures in Profile:", font=('Arial', 12, 'bold')).pack(anchor='w')
+        ttk.Label(list_frame, text="Gestures in Profile:", font=_font(12, bold=True)).pack(anchor='w')
 
         # Create treeview for gestures
         columns = ('Name', 'Key', 'Type')
@@ -202,34 +490,39 @@ class GestureSettingsGUI:
         gesture_buttons = ttk.Frame(gesture_section)
         gesture_buttons.pack(fill='x', pady=(10, 0))
 
-        ttk.Button(gesture_buttons, text="🗑️ Delete Gesture",
+        ttk.Button(gesture_buttons, text=_button_text("🗑️ Delete Gesture"),
                   command=self.delete_selected_gesture).pack(side='left', padx=5)
 
-        ttk.Button(gesture_buttons, text="💾 Save Profile",
+        ttk.Button(gesture_buttons, text=_button_text("💾 Save Profile"),
                   command=self.save_current_profile).pack(side='left', padx=5)
 
-        ttk.Button(gesture_buttons, text="🎮 Activate Profile",
+        ttk.Button(gesture_buttons, text=_button_text("🎮 Activate Profile"),
                   command=self.activate_current_profile).pack(side='left', padx=5)
 
+    def _build_step3(self, parent):
+        """Build Step 3: the profile status line"""
         # Step 3: Profile Status
         status_section = ttk.LabelFrame(parent, text="Step 3: Profile Status", padding=15)
         status_section.pack(fill='x')
 
+        self.status_var = tk.StringVar(value="Select a profile to get started")
         self.status_label = ttk.Label(status_section,
-                                     text="Select a profile to get started",
-                                     font=('Arial', 11))
+                                     textvariable=self.status_var,
+                                     font=_font(11))
         self.status_label.pack()
+        self._track_live(self.status_label)
 
-        # Initialize
-        self.refresh_profile_dropdown()
-        self.refresh_gesture_list()
-        self.update_status()
+    def _track_live(self, widget):
+        """Remember a widget as alive until it is destroyed"""
+        self._live.add(widget)
+        # A toplevel also sees <Destroy> for each of its children, so check which widget went away
+        widget.bind('<Destroy>', lambda event, w=widget: event.widget is w and self._live.discard(w))
 
     def refresh_profile_dropdown(self):
         """Refresh the profile dropdown list"""
-        if hasattr(self, 'profile_dropdown'):
-            profiles = self.profile_manager.get_profile_names()
-            self.profile_dropdown['values'] = profiles
+        if self.profile_dropdown is not None:
+            profiles = self._get_profile_names_cached()
+            self.profile_dropdown['values'] = profiles[:PROFILE_DROPDOWN_LIMIT]
 
             # Set current selection
             if self.profile_manager.current_profile in profiles:
@@ -237,18 +530,26 @@ class GestureSettingsGUI:
             elif profiles:
                 self.profile_var.set('')
 
+    def _filter_dropdown(self, event=None):
+        """Show only the profile names containing the typed text"""
+        query = self.profile_var.get().lower()
+        matches = [name for name in self._get_profile_names_cached() if query in name.lower()]
+        self.profile_dropdown['values'] = matches[:PROFILE_DROPDOWN_LIMIT]
+
     def on_profile_selected(self, event=None):
         """Handle profile selection from dropdown"""
         selected_profile = self.profile_var.get()
         if selected_profile and selected_profile != self.profile_manager.current_profile:
+            self._flush_profile_save()
+
             # Clear current profile first to avoid mixing
             self.profile_manager.clear_current_profile()
 
             # Load the selected profile
-            if self.profile_manager.load_profile(selected_profile):
-                self.update_profile_labels()
-                self.refresh_gesture_list()
-                self.update_status()
+            loaded = self.profile_manager.load_profile(selected_profile)
+            self._invalidate_profile_cache()
+            if loaded:
+                self._schedule_refresh()
                 print(f"✅ Switched to profile: {selected_profile}")
 
                 # Debug: Show what gestures are in this profile
@@ -258,242 +559,255 @@ class GestureSettingsGUI:
 
     def create_new_profile_simple(self):
         """Simple profile creation dialog"""
-        name = tk.simpledialog.askstring("New Profile", "Enter profile name:")
+        name = askstring("New Profile", "Enter profile name:")
         if name and name.strip():
             name = name.strip()
-            if name in self.profile_manager.get_profile_names():
-                messagebox.showerror("Error", "Profile name already exists")
+            if name in self._get_profile_names_cached():
+                showerror("Error", "Profile name already exists")
                 return
 
             if self.profile_manager.create_profile(name, f"Custom profile: {name}"):
                 self.profile_manager.load_profile(name)
-                self.refresh_profile_dropdown()
-                self.update_profile_labels()
-                self.refresh_gesture_list()
-                self.update_status()
-                messagebox.showinfo("Success", f"Profile '{name}' created and loaded!")
+                self._invalidate_profile_cache()
+                self._schedule_refresh()
+                showinfo("Success", f"Profile '{name}' created and loaded!")
             else:
-                messagebox.showerror("Error", "Failed to create profile")
+                showerror("Error", "Failed to create profile")
 
     def create_template_profile_simple(self, template_name):
         """Create and load a template profile"""
-        if template_name in self.profile_manager.get_profile_names():
+        if template_name in self._get_profile_names_cached():
             # Ask if user wants to load existing or replace
-            result = messagebox.askyesnocancel("Profile Exists",
-                                             f"Profile '{template_name}' already exists.\n\n"
-                                             f"Yes: Load existing profile\n"
-                                             f"No: Replace with new template\n"
-                                             f"Cancel: Do nothing")
+            result = askyesnocancel("Profile Exists",
+                                  f"Profile '{template_name}' already exists.\n\n"
+                                  f"Yes: Load existing profile\n"
+                                  f"No: Replace with new template\n"
+                                  f"Cancel: Do nothing")
             if result is None:  # Cancel
                 return
             elif result:  # Yes - load existing
                 self.profile_manager.load_profile(template_name)
-                self.refresh_profile_dropdown()
-                self.update_profile_labels()
-                self.refresh_gesture_list()
-                self.update_status()
+                self._invalidate_profile_cache()
+                self._schedule_refresh()
                 return
             else:  # No - replace
+                self._discard_pending_save(template_name)
                 self.profile_manager.delete_profile(template_name)
+                self._invalidate_profile_cache()
 
         # Create new template
         if self.profile_manager.create_template_profile(template_name):
             self.profile_manager.load_profile(template_name)
-            self.refresh_profile_dropdown()
-            self.update_profile_labels()
-            self.refresh_gesture_list()
-            self.update_status()
-            messagebox.showinfo("Success", f"Template '{template_name}' created!\n\n"
-                                         f"Now you can add gestures one by one.")
+            self._invalidate_profile_cache()
+            self._schedule_refresh()
+            showinfo("Success", f"Template '{template_name}' created!\n\n"
+                              f"Now you can add gestures one by one.")
         else:
-            messagebox.showerror("Error", "Failed to create template profile")
+            showerror("Error", "Failed to create template profile")
 
     def record_gesture_simple(self):
         """Simple gesture recording - immediate recording with countdown"""
+        # Ignore repeat triggers while a recording is already under way
+        if self._recording_in_progress:
+            return
+
         if not self.profile_manager.current_profile:
-            messagebox.showerror("Error", "Please select or create a profile first")
+            showerror("Error", "Please select or create a profile first")
             return
 
+        # Fetch profile data once for both the existing-gesture and binding checks
+        profile_data = self._get_current_profile_data_cached()
+
         gesture_name = self.gesture_name_entry.get().strip()
         key_binding = self.key_binding_entry.get().strip()
 
         if not gesture_name:
-            messagebox.showerror("Error", "Please enter a gesture name")
+            showerror("Error", "Please enter a gesture name")
             self.gesture_name_entry.focus()
             return
 
         if not key_binding:
-            messagebox.showerror("Error", "Please enter a key binding")
+            showerror("Error", "Please enter a key binding")
             self.key_binding_entry.focus()
             return
 
         # Check if gesture already exists
-        profile_data = self.profile_manager.get_current_profile_data()
         if profile_data and gesture_name in profile_data.get('gestures', {}):
-            result = messagebox.askyesno("Gesture Exists",
-                                       f"Gesture '{gesture_name}' already exists. Replace it?")
+            result = askyesno("Gesture Exists",
+                            f"Gesture '{gesture_name}' already exists. Replace it?")
             if not result:
                 return
 
-        # Check if key binding is already used by another gesture
-        if profile_data:
-            existing_bindings = profile_data.get('bindings', {})
-            conflicting_gestures = [g_name for g_name, g_key in existing_bindings.items()
-                                  if g_key == key_binding and g_name != gesture_name]
-
-            if conflicting_gestures:
-                conflict_list = ', '.join(conflicting_gestures)
-                result = messagebox.askyesnocancel(
-                    "Key Binding Conflict",
-                    f"Key '{key_binding}' is already bound to: {conflict_list}\n\n"
-                    f"Do you want to bind '{gesture_name}' to the same key?\n\n"
-                    f"Yes: Add another gesture with same key\n"
-                    f"No: Choose a different key\n"
-                    f"Cancel: Stop recording"
-                )
-
-                if result is None:  # Cancel
-                    return
-                elif result is False:  # No - choose different key
-                    messagebox.showinfo("Choose Different Key",
-                                      f"Please enter a different key binding for '{gesture_name}'")
-                    self.key_binding_entry.focus()
-                    return
-                # If Yes, continue with the recording
+        # Key binding conflicts are shown live by _validate_key_binding; sharing a key is allowed
 
         # Get hand type
         hand_type = self.hand_type_var.get()
 
         # Show appropriate message for both-hand recording
         if hand_type == "both":
-            messagebox.showinfo("Both-Hand Recording",
-                               "You selected both-hand recording.\n\n"
-                               "During recording:\n"
-                               "• Show your gesture using BOTH hands\n"
-                               "• For numbers 6-10: Use both hands together\n"
-                               "• Example: 6 = 5 fingers (right) + 1 finger (left)")
-
-        # Disable the record button and show status
-        self.record_button.config(state='disabled', text="🔴 Recording...")
-
-        # Start recording session if not active
+            showinfo("Both-Hand Recording",
+                    "You selected both-hand recording.\n\n"
+                    "During recording:\n"
+                    "• Show your gesture using BOTH hands\n"
+                    "• For numbers 6-10: Use both hands together\n"
+                    "• Example: 6 = 5 fingers (right) + 1 finger (left)")
+
+        # Mark recording as started before anything else can dispatch, then disable the button
+        self._recording_in_progress = True
+        self.record_button.config(state='disabled', text=_button_text("🔴 Recording..."))
+
+        # Start recording session if not active (this reloads the profile)
         if not self.recording_session.current_profile:
+            self._flush_profile_save(wait=True)
             self.recording_session.start_session(self.profile_manager.current_profile)
+            self._invalidate_profile_cache()
 
         # Start recording immediately
-        self.recording_session.record_gesture(gesture_name, key_binding, hand_type)
+        self._recording_finished.clear()
+        if not self.recording_session.record_gesture(gesture_name, key_binding, hand_type):
+            # Recorder never started, so release the GUI right away
+            self._recording_finished.set()
 
         # Clear the form
         self.gesture_name_entry.delete(0, tk.END)
         self.key_binding_entry.delete(0, tk.END)
+        self._validate_key_binding()
 
-        # Set up completion callback
+        # Set up completion callback: all GUI updates go into one idle pass
         def on_recording_complete():
-            try:
-                self.record_button.config(state='normal', text="🔴 Record Gesture")
-                self.refresh_gesture_list()
-                self.update_status()
-                self.gesture_name_entry.focus()  # Focus back to name entry for next gesture
-            except Exception as e:
-                print(f"Warning: Error in completion callback: {e}")
+            window.after_idle(self._recording_finished_ui)
 
-        # Schedule GUI reset after recording completes
-        if self.settings_window:
-            self.settings_window.after(7000, on_recording_complete)  # 3s countdown + 3s recording + 1s buffer
+        # Reset the GUI as soon as the recorder reports completion
+        window = self.root or self.settings_window
+        if window:
+            self._watch_recording(window, on_recording_complete)
 
-    def update_status(self):
-        """Update the status display safely"""
-        if not hasattr(self, 'status_label') or not self.status_label:
+    def _recording_finished_ui(self):
+        """Re-enable recording and refresh the gesture list and status together"""
+        self._recording_in_progress = False
+        try:
+            self.record_button.config(state='normal', text=_button_text("🔴 Record Gesture"))
+            self.refresh_gesture_list()
+            self.update_status()
+            self.gesture_name_entry.focus()  # Focus back to name entry for next gesture
+        except Exception as e:
+            print(f"Warning: Error in completion callback: {e}")
+
+    def _get_conflicting_gestures(self, gesture_name, key_binding):
+        """Get other gestures in the current profile already bound to key_binding"""
+        binding_index = self.profile_manager.get_binding_index()
+        return [g_name for g_name in binding_index.get(key_binding, ()) if g_name != gesture_name]
+
+    def _validate_key_binding(self, event=None):
+        """Show an inline note while the entered key is already used by another gesture"""
+        if not self.key_conflict_label:
             return
 
-        try:
-            # Check if the widget still exists
-            self.status_label.winfo_exists()
-        except tk.TclError:
-            # Widget has been destroyed
+        gesture_name = self.gesture_name_entry.get().strip()
+        key_binding = self.key_binding_entry.get().strip()
+        conflicting_gestures = self._get_conflicting_gestures(gesture_name, key_binding) if key_binding else []
+
+        if conflicting_gestures:
+            conflict_list = ', '.join(conflicting_gestures)
+            self.key_conflict_label.config(text=f"⚠️ Key '{key_binding}' is already bound to: {conflict_list} "
+                                                f"- recording will add another gesture on the same key")
+        else:
+            self.key_conflict_label.config(text="")
+
+    def update_status(self):
+        """Update the status display safely"""
+        if self.status_label not in self._live:
             return
 
         if not self.profile_manager.current_profile:
-            try:
-                self.status_label.config(text="❌ No profile selected - Create or select a profile to get started")
-            except tk.TclError:
-                pass
+            self.status_var.set("❌ No profile selected - Create or select a profile to get started")
             return
 
-        profile_data = self.profile_manager.get_current_profile_data()
+        profile_data = self._get_current_profile_data_cached()
         if not profile_data:
-            try:
-                self.status_label.config(text="❌ Profile data not available")
-            except tk.TclError:
-                pass
+            self.status_var.set("❌ Profile data not available")
             return
 
         total_gestures = len(profile_data.get('gestures', {}))
 
-        try:
-            if total_gestures == 0:
-                self.status_label.config(text=f"✅ Profile '{self.profile_manager.current_profile}' loaded - Add gestures to get started")
-            else:
-                self.status_label.config(text=f"✅ Profile '{self.profile_manager.current_profile}' - {total_gestures} gestures ready")
-        except tk.TclError:
-            # Widget has been destroyed, ignore
-            pass
+        if total_gestures == 0:
+            self.status_var.set(f"✅ Profile '{self.profile_manager.current_profile}' loaded - Add gestures to get started")
+        else:
+            self.status_var.set(f"✅ Profile '{self.profile_manager.current_profile}' - {total_gestures} gestures ready")
+
+    def _on_current_profile_changed(self, *args):
+        """Trace callback: refresh the status line whenever the current profile variable is written"""
+        self.update_status()
 
     def save_current_profile(self):
         """Save the current profile"""
         if not self.profile_manager.current_profile:
-            messagebox.showerror("Error", "No profile selected")
+            showerror("Error", "No profile selected")
             return
 
-        profile_data = self.profile_manager.get_current_profile_data()
+        profile_data = self._get_current_profile_data_cached()
         if profile_data:
             # Activate all gestures in the profile
             gestures = profile_data.get('gestures', {})
             profile_data['active_gestures'] = list(gestures.keys())
+            profile_name = self.profile_manager.current_profile
+            gesture_count = len(gestures)
 
-            if self.profile_manager.save_profile(self.profile_manager.current_profile, profile_data):
-                messagebox.showinfo("Success", f"Profile '{self.profile_manager.current_profile}' saved!\n\n"
-                                              f"All {len(gestures)} gestures are ready to use.")
-                self.update_status()
-            else:
-                messagebox.showerror("Error", "Failed to save profile")
+            def on_saved(saved, error):
+                if saved:
+                    showinfo("Success", f"Profile '{profile_name}' saved!\n\n"
+                                       f"All {gesture_count} gestures are ready to use.")
+                    self.update_status()
+                else:
+                    showerror("Error", "Failed to save profile")
+
+            self._save_profile_snapshot(profile_name, profile_data, on_saved)
 
     def activate_current_profile(self):
         """Activate the current profile for gesture recognition"""
         if not self.profile_manager.current_profile:
-            messagebox.showerror("Error", "No profile selected")
+            showerror("Error", "No profile selected")
             return
 
-        profile_data = self.profile_manager.get_current_profile_data()
+        profile_data = self._get_current_profile_data_cached()
         if not profile_data:
-            messagebox.showerror("Error", "Profile data not available")
+            showerror("Error", "Profile data not available")
             return
 
         gestures = profile_data.get('gestures', {})
         if not gestures:
-            messagebox.showwarning("Warning", "Profile has no gestures to activate")
+            showwarning("Warning", "Profile has no gestures to activate")
             return
 
         # Activate all gestures
         profile_data['active_gestures'] = list(gestures.keys())
-        self.profile_manager.save_profile(self.profile_manager.current_profile, profile_data)
+        profile_name = self.profile_manager.current_profile
+        gesture_count = len(gestures)
 
-        messagebox.showinfo("Profile Activated",
-                           f"Profile '{self.profile_manager.current_profile}' is now active!\n\n"
-                           f"All {len(gestures)} gestures are ready to use.\n"
-                           f"Press 'p' in the camera window to see profile selector.")
+        def on_saved(saved, error):
+            if not saved:
+                showerror("Error", "Failed to activate profile")
+                return
 
-        # Update status before closing window
-        self.update_status()
+            showinfo("Profile Activated",
+                    f"Profile '{profile_name}' is now active!\n\n"
+                    f"All {gesture_count} gestures are ready to use.\n"
+                    f"Press 'p' in the camera window to see profile selector.")
 
-        # Close settings window
-        self.close_settings_window()
+            # Update status before closing window
+            self.update_status()
+
+            # Close settings window
+            self.close_settings_window()
+
+        self._save_profile_snapshot(profile_name, profile_data, on_saved)
 
     def open_profile_selector(self):
         """Open simplified profile selector window (triggered by 'p' key)"""
         # Create profile selector window
         selector_window = tk.Toplevel(self.root if self.root else None)
         selector_window.title("🎮 Profile Selector")
+        self._configure_label_styles()
         selector_window.geometry("500x400")
 
         # Center the window
@@ -504,7 +818,7 @@ class GestureSettingsGUI:
 
         # Title
         title_label = ttk.Label(selector_window, text="🎮 Profile Selector",
-                               font=('Arial', 16, 'bold'))
+                               font=_font(16, bold=True))
         title_label.pack(pady=15)
 
         # Current profile display
@@ -512,12 +826,13 @@ class GestureSettingsGUI:
         current_frame.pack(fill='x', padx=20, pady=10)
 
         ttk.Label(current_frame, text="Currently Active:",
-                 font=('Arial', 12, 'bold')).pack(side='left')
+                 font=_font(12, bold=True)).pack(side='left')
 
         current_name = self.profile_manager.current_profile or "None"
         current_label = ttk.Label(current_frame, text=current_name,
-                                 font=('Arial', 12), foreground='green')
+                                 font=_font(12), style='Green.TLabel')
         current_label.pack(side='left', padx=(10, 0))
+        self._selector_current_label = current_label
 
         # Profile list frame
         list_frame = ttk.LabelFrame(selector_window, text="Available Profiles", padding=15)
@@ -530,10 +845,10 @@ class GestureSettingsGUI:
         button_frame = ttk.Frame(selector_window)
         button_frame.pack(fill='x', padx=20, pady=10)
 
-        ttk.Button(button_frame, text="⚙️ Open Settings",
+        ttk.Button(button_frame, text=_button_text("⚙️ Open Settings"),
                   command=lambda: self.open_settings_from_selector(selector_window)).pack(side='left', padx=5)
 
-        ttk.Button(button_frame, text="❌ Close",
+        ttk.Button(button_frame, text=_button_text("❌ Close"),
                   command=selector_window.destroy).pack(side='right', padx=5)
 
         # Focus the window
@@ -541,155 +856,261 @@ class GestureSettingsGUI:
         selector_window.grab_set()
 
     def create_simple_profile_list(self, parent, selector_window):
-        """Create simple profile list with Load/Delete buttons"""
+        """Create simple profile list with Load/Delete buttons, building only the visible rows"""
         # Get profiles quickly
-        profiles = self.profile_manager.get_profile_names()
+        profiles = list(self._get_profile_names_cached())
 
         if not profiles:
             ttk.Label(parent, text="No profiles available.\nCreate one in Settings.",
-                     font=('Arial', 12), foreground='gray').pack(pady=20)
+                     font=_font(12), style='Gray.TLabel').pack(pady=20)
             return
 
-        # Create scrollable frame
-        canvas = tk.Canvas(parent)
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        # Create scrollable canvas; row widgets sit directly on it and are recycled while scrolling
+        canvas = tk.Canvas(parent, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self._scroll_profile_list)
+        canvas.configure(yscrollcommand=scrollbar.set)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Fetch basic info for every profile in one call instead of one lookup per row
+        self._profile_info_cache.update(self.profile_manager.get_all_profiles_basic_info())
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self._profile_list_canvas = canvas
+        self._profile_list_names = profiles
+        self._profile_list_selector = selector_window
+        self._profile_row_pool = []
+        self._update_profile_list_scrollregion()
 
-        # Add profiles
-        for profile_name in profiles:
-            self.create_simple_profile_row(scrollable_frame, profile_name, selector_window)
+        canvas.bind("<Configure>", self._on_profile_list_configure)
+        self._bind_profile_list_wheel(canvas)
 
         # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-    def create_simple_profile_row(self, parent, profile_name, selector_window):
-        """Create a simple row for each profile"""
+        self._render_profile_rows()
+
+    def create_simple_profile_row(self, canvas):
+        """Create one reusable profile row; its contents are filled in by _populate_profile_row"""
         # Create row frame
-        row_frame = ttk.Frame(parent)
-        row_frame.pack(fill='x', pady=5, padx=5)
+        row_frame = ttk.Frame(canvas)
+
+        # Separator
+        ttk.Separator(row_frame, orient='horizontal').pack(side='bottom', fill='x')
 
         # Profile info frame
         info_frame = ttk.Frame(row_frame)
-        info_frame.pack(side='left', fill='x', expand=True)
+        info_frame.pack(side='left', fill='x', expand=True, padx=5, pady=5)
 
         # Profile name
-        name_label = ttk.Label(info_frame, text=f"📁 {profile_name}",
-                              font=('Arial', 12, 'bold'))
+        name_label = ttk.Label(info_frame, font=_font(12, bold=True))
         name_label.pack(anchor='w')
 
-        # Quick gesture count using basic info
-        try:
-            basic_info = self.profile_manager.get_profile_basic_info(profile_name)
-            if basic_info:
-                gesture_count = basic_info.get('gesture_count', 0)
-                count_text = f"{gesture_count} gestures"
-
-                # Add description if available
-                description = basic_info.get('description', '')
-                if description and len(description) > 0:
-                    # Truncate long descriptions
-                    if len(description) > 30:
-                        description = description[:30] + "..."
-                    count_text += f" • {description}"
-            else:
-                count_text = "No info available"
-        except:
-            count_text = "Loading..."
-
-        count_label = ttk.Label(info_frame, text=count_text,
-                               font=('Arial', 10), foreground='gray')
+        # Gesture count and description
+        count_label = ttk.Label(info_frame, font=_font(10), style='Gray.TLabel')
         count_label.pack(anchor='w')
 
-        # Current profile indicator
-        if profile_name == self.profile_manager.current_profile:
-            status_label = ttk.Label(info_frame, text="✅ Currently Active",
-                                   font=('Arial', 10), foreground='green')
-            status_label.pack(anchor='w')
+        # Current profile indicator (left empty for other profiles to keep rows the same height)
+        status_label = ttk.Label(info_frame, font=_font(10), style='Green.TLabel')
+        status_label.pack(anchor='w')
 
         # Buttons frame
         button_frame = ttk.Frame(row_frame)
-        button_frame.pack(side='right', padx=(10, 0))
+        button_frame.pack(side='right', padx=(10, 5))
 
         # Load button
-        load_button = ttk.Button(button_frame, text="📂 Load",
-                                command=lambda: self.load_profile_quick(profile_name, selector_window))
+        load_button = ttk.Button(button_frame, text=_button_text("📂 Load"))
         load_button.pack(side='top', pady=2)
 
         # Delete button
-        delete_button = ttk.Button(button_frame, text="🗑️ Delete",
-                                  command=lambda: self.delete_profile_quick(profile_name, selector_window))
+        delete_button = ttk.Button(button_frame, text=_button_text("🗑️ Delete"))
         delete_button.pack(side='top', pady=2)
 
-        # Separator
-        ttk.Separator(parent, orient='horizontal').pack(fill='x', pady=5)
+        for widget in (row_frame, info_frame, name_label, count_label, status_label, button_frame):
+            self._bind_profile_list_wheel(widget)
+
+        window = canvas.create_window(0, 0, window=row_frame, anchor='nw',
+                                      width=canvas.winfo_width(), height=PROFILE_ROW_HEIGHT)
+
+        return {
+            'window': window,
+            'profile': None,
+            'name_label': name_label,
+            'count_label': count_label,
+            'status_label': status_label,
+            'load_button': load_button,
+            'delete_button': delete_button
+        }
+
+    def _populate_profile_row(self, row, profile_name):
+        """Point a pooled row at a profile, skipping the work if it already shows it"""
+        if row['profile'] == profile_name:
+            return
+        row['profile'] = profile_name
+
+        selector_window = self._profile_list_selector
+        is_current = profile_name == self.profile_manager.current_profile
+
+        row['name_label'].config(text=f"📁 {profile_name}")
+        row['count_label'].config(text=self._get_profile_count_text(profile_name))
+        row['status_label'].config(text="✅ Currently Active" if is_current else "")
+        row['load_button'].config(command=partial(self.load_profile_quick, profile_name, selector_window))
+        row['delete_button'].config(command=partial(self.delete_profile_quick, profile_name, selector_window))
+
+    def _get_profile_count_text(self, profile_name):
+        """Build the gesture count line for a profile row, memoizing the basic info lookup"""
+        # Quick gesture count using basic info
+        try:
+            if profile_name not in self._profile_info_cache:
+                self._profile_info_cache[profile_name] = self.profile_manager.get_profile_basic_info(profile_name)
+            basic_info = self._profile_info_cache[profile_name]
+        except:
+            return "Loading..."
+
+        if not basic_info:
+            return "No info available"
+
+        gesture_count = basic_info.get('gesture_count', 0)
+        count_text = f"{gesture_count} gestures"
+
+        # Add description if available
+        description = basic_info.get('description', '')
+        if description and len(description) > 0:
+            # Truncate long descriptions
+            if len(description) > 30:
+                description = description[:30] + "..."
+            count_text += f" • {description}"
+
+        return count_text
+
+    def _render_profile_rows(self):
+        """Place pooled rows over the profiles in view, growing the pool only as needed"""
+        canvas = self._profile_list_canvas
+        names = self._profile_list_names
+
+        top = max(0, int(canvas.canvasy(0)))
+        first = top // PROFILE_ROW_HEIGHT
+        last = min(len(names) - 1, (top + canvas.winfo_height()) // PROFILE_ROW_HEIGHT)
+
+        while len(self._profile_row_pool) < last - first + 1:
+            self._profile_row_pool.append(self.create_simple_profile_row(canvas))
+
+        for offset, row in enumerate(self._profile_row_pool):
+            index = first + offset
+            if index <= last:
+                self._populate_profile_row(row, names[index])
+                canvas.coords(row['window'], 0, index * PROFILE_ROW_HEIGHT)
+                canvas.itemconfigure(row['window'], state='normal')
+            else:
+                canvas.itemconfigure(row['window'], state='hidden')
+
+    def _remove_profile_row(self, profile_name):
+        """Remove a deleted profile from the open selector without rebuilding it"""
+        if profile_name in self._profile_list_names:
+            self._profile_list_names.remove(profile_name)
+
+        # Rows below the deleted one shift up, so every pooled row gets refilled
+        for row in self._profile_row_pool:
+            row['profile'] = None
+
+        if self._selector_current_label is not None:
+            self._selector_current_label.config(text=self.profile_manager.current_profile or "None")
+
+        self._update_profile_list_scrollregion()
+        self._render_profile_rows()
+
+    def _update_profile_list_scrollregion(self):
+        """Size the scroll region from the row count; call only when the number of rows changes"""
+        canvas = self._profile_list_canvas
+        canvas.configure(scrollregion=(0, 0, canvas.winfo_width(),
+                                       len(self._profile_list_names) * PROFILE_ROW_HEIGHT))
+
+    def _scroll_profile_list(self, *args):
+        """Scrollbar command: scroll the profile list and realize the rows now in view"""
+        self._profile_list_canvas.yview(*args)
+        self._render_profile_rows()
+
+    def _on_profile_list_wheel(self, event):
+        """Scroll the profile list with the mouse wheel"""
+        step = -1 if event.num == 4 or event.delta > 0 else 1
+        self._profile_list_canvas.yview_scroll(step, 'units')
+        self._render_profile_rows()
+
+    def _bind_profile_list_wheel(self, widget):
+        """Route mouse wheel events over a widget to the profile list"""
+        widget.bind("<MouseWheel>", self._on_profile_list_wheel)
+        widget.bind("<Button-4>", self._on_profile_list_wheel)
+        widget.bind("<Button-5>", self._on_profile_list_wheel)
+
+    def _on_profile_list_configure(self, event):
+        """Stretch rows to the canvas width and fill any newly exposed space (scroll region is left alone)"""
+        for row in self._profile_row_pool:
+            self._profile_list_canvas.itemconfigure(row['window'], width=event.width)
+        self._render_profile_rows()
 
     def load_profile_quick(self, profile_name, selector_window):
         """Quickly load and activate a profile with clean switching"""
-        try:
-            # Clear current profile first to ensure clean switch
-            self.profile_manager.clear_current_profile()
+        self._flush_profile_save()
 
-            # Load the selected profile
-            if self.profile_manager.load_profile(profile_name):
-                # Activate all gestures in the profile
-                profile_data = self.profile_manager.get_current_profile_data()
-                if profile_data:
-                    gestures = profile_data.get('gestures', {})
-                    profile_data['active_gestures'] = list(gestures.keys())
-                    self.profile_manager.save_profile(profile_name, profile_data)
-
-                    # Debug: Show what gestures are loaded
-                    print(f"🔍 Loaded profile '{profile_name}' with gestures: {list(gestures.keys())}")
-
-                    # Show success message
-                    messagebox.showinfo("Profile Loaded",
-                                       f"✅ Profile '{profile_name}' loaded and activated!\n\n"
-                                       f"🎮 {len(gestures)} gestures ready to use.\n\n"
-                                       f"Gestures: {', '.join(list(gestures.keys())[:5])}{'...' if len(gestures) > 5 else ''}")
-
-                    # Close selector window
-                    selector_window.destroy()
+        # Clear current profile first to ensure clean switch
+        self.profile_manager.clear_current_profile()
+        self._invalidate_profile_cache()
 
-                    # Update any open settings window
-                    self.update_profile_labels()
-                    self.refresh_gesture_list()
-                    self.update_status()
-                else:
-                    messagebox.showerror("Error", "Failed to load profile data")
-            else:
-                messagebox.showerror("Error", "Failed to load profile")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load profile: {e}")
+        def on_loaded(profile_data, error):
+            if error is not None:
+                showerror("Error", f"Failed to load profile: {error}")
+                return
+            if not profile_data:
+                showerror("Error", "Failed to load profile")
+                return
+
+            self._invalidate_profile_cache()
+            gestures = profile_data.get('gestures', {})
+
+            # Debug: Show what gestures are loaded
+            print(f"🔍 Loaded profile '{profile_name}' with gestures: {list(gestures.keys())}")
+
+            # Show success message
+            showinfo("Profile Loaded",
+                    f"✅ Profile '{profile_name}' loaded and activated!\n\n"
+                    f"🎮 {len(gestures)} gestures ready to use.\n\n"
+                    f"Gestures: {', '.join(list(gestures.keys())[:5])}{'...' if len(gestures) > 5 else ''}")
+
+            # Close selector window
+            selector_window.destroy()
+
+            # Update any open settings window
+            self._schedule_refresh()
+
+        # Load the selected profile and activate all its gestures off the Tk thread
+        self._run_profile_io(self._load_and_activate_profile, (profile_name,), on_loaded)
 
     def delete_profile_quick(self, profile_name, selector_window):
         """Quickly delete a profile with confirmation"""
-        result = messagebox.askyesno("Confirm Delete",
-                                   f"Are you sure you want to delete profile '{profile_name}'?\n\n"
-                                   f"This action cannot be undone.")
+        result = askyesno("Confirm Delete",
+                        f"Are you sure you want to delete profile '{profile_name}'?\n\n"
+                        f"This action cannot be undone.")
         if result:
-            try:
-                if self.profile_manager.delete_profile(profile_name):
-                    messagebox.showinfo("Success", f"Profile '{profile_name}' deleted successfully!")
-
-                    # Refresh the profile list
-                    selector_window.destroy()
-                    self.open_profile_selector()  # Reopen with updated list
+            def on_deleted(deleted, error):
+                if error is not None:
+                    showerror("Error", f"Failed to delete profile: {error}")
+                elif deleted:
+                    self._invalidate_profile_cache()
+                    showinfo("Success", f"Profile '{profile_name}' deleted successfully!")
+
+                    # Drop the row in place; rebuild only when the list becomes empty
+                    if self._profile_list_selector is selector_window and len(self._profile_list_names) > 1:
+                        self._remove_profile_row(profile_name)
+                    else:
+                        selector_window.destroy()
+                        self.open_profile_selector()  # Reopen with updated list
 
                     # Update any open settings window
-                    self.update_profile_labels()
+                    self._schedule_refresh()
                 else:
-                    messagebox.showerror("Error", "Failed to delete profile")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete profile: {e}")
+                    showerror("Error", "Failed to delete profile")
+
+            # Drop any pending debounced save so it cannot write the file back after the delete
+            self._discard_pending_save(profile_name)
+            self._run_profile_io(self.profile_manager.delete_profile, (profile_name,), on_deleted)
 
     # Old complex profile list methods removed - using simplified version
 
@@ -698,589 +1119,250 @@ class GestureSettingsGUI:
         selector_window.destroy()
         self.open_settings_window()
     
-    def create_profile_management_tab_OLD(self, parent):
-        """Create profile management tab"""
-        # Title
-        title_label = ttk.Label(parent, text="📁 Gesture Profile Management", 
-                               font=('Arial', 16, 'bold'))
-        title_label.pack(pady=10)
-
-        # Current profile display
-        current_frame = ttk.Frame(parent)
-        current_frame.pack(fill='x', padx=20, pady=10)
-
-        ttk.Label(current_frame, text="Current Profile:", 
-                 font=('Arial', 12, 'bold')).pack(side='left')
-        
-        current_profile_name = self.profile_manager.current_profile or "None"
-        self.current_profile_label = ttk.Label(current_frame, text=current_profile_name,
-                                              font=('Arial', 12), foreground='blue')
-        self.current_profile_label.pack(side='left', padx=(10, 0))
-
-        # Profile list
-        list_frame = ttk.LabelFrame(parent, text="Available Profiles", padding=10)
-        list_frame.pack(fill='both', expand=True, padx=20, pady=10)
-
-        # Profile listbox with scrollbar
-        listbox_frame = ttk.Frame(list_frame)
-        listbox_frame.pack(fill='both', expand=True)
-
-        self.profile_listbox = tk.Listbox(listbox_frame, height=8)
-        scrollbar = ttk.Scrollbar(listbox_frame, orient='vertical', 
-                                 command=self.profile_listbox.yview)
-        self.profile_listbox.configure(yscrollcommand=scrollbar.set)
-
-        self.profile_listbox.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
-
-        # Buttons
-        button_frame = ttk.Frame(parent)
-        button_frame.pack(pady=10)
-
-        ttk.Button(button_frame, text="📂 Create New Profile",
-                  command=self.create_new_profile_dialog).pack(side='left', padx=5)
-
-        ttk.Button(button_frame, text="📋 Load Profile",
-                  command=self.load_selected_profile).pack(side='left', padx=5)
-
-        ttk.Button(button_frame, text="🔄 Refresh List",
-                  command=self.refresh_profile_list).pack(side='left', padx=5)
-
-        ttk.Button(button_frame, text="🗑️ Delete Profile",
-                  command=self.delete_selected_profile).pack(side='left', padx=5)
-
-        # Profile templates
-        template_frame = ttk.LabelFrame(parent, text="Quick Templates", padding=10)
-        template_frame.pack(fill='x', padx=20, pady=10)
-
-        template_buttons = ttk.Frame(template_frame)
-        template_buttons.pack()
-
-        ttk.Button(template_buttons, text="🏎️ Racing Game",
-                  command=lambda: self.create_template_profile("Racing Game")).pack(side='left', padx=5)
-
-        ttk.Button(template_buttons, text="🎥 Video Player",
-                  command=lambda: self.create_template_profile("Video Player")).pack(side='left', padx=5)
-
-        ttk.Button(template_buttons, text="🎮 General Gaming",
-                  command=lambda: self.create_template_profile("General Gaming")).pack(side='left', padx=5)
-
-        # Initial refresh
-        self.refresh_profile_list()
-    
-    def create_add_gesture_tab_OLD(self, parent):
-        """Create add gesture tab"""
-        # Title
-        title_label = ttk.Label(parent, text="➕ Add Gesture to Profile", 
-                               font=('Arial', 16, 'bold'))
-        title_label.pack(pady=10)
-
-        # Profile selection
-        profile_frame = ttk.Frame(parent)
-        profile_frame.pack(fill='x', padx=20, pady=10)
-
-        ttk.Label(profile_frame, text="Profile:", font=('Arial', 12, 'bold')).pack(side='left')
-        
-        self.selected_profile_label = ttk.Label(profile_frame, 
-                                               text=self.profile_manager.current_profile or "No profile selected",
-                                               font=('Arial', 12), foreground='blue')
-        self.selected_profile_label.pack(side='left', padx=(10, 0))
-
-        # Template gestures section
-        template_frame = ttk.LabelFrame(parent, text="Template Gestures", padding=10)
-        template_frame.pack(fill='x', padx=20, pady=10)
-
-        # Template gestures list
-        self.create_template_gestures_section(template_frame)
-
-        # Custom gesture details
-        details_frame = ttk.LabelFrame(parent, text="Custom Gesture Details", padding=10)
-        details_frame.pack(fill='x', padx=20, pady=10)
-
-        # Gesture name
-        name_frame = ttk.Frame(details_frame)
-        name_frame.pack(fill='x', pady=5)
-        ttk.Label(name_frame, text="Gesture Name:", width=15).pack(side='left')
-        self.gesture_name_entry = ttk.Entry(name_frame, width=20)
-        self.gesture_name_entry.pack(side='left', padx=(5, 0))
-
-        # Key binding
-        key_frame = ttk.Frame(details_frame)
-        key_frame.pack(fill='x', pady=5)
-        ttk.Label(key_frame, text="Key Binding:", width=15).pack(side='left')
-        self.key_binding_entry = ttk.Entry(key_frame, width=20)
-        self.key_binding_entry.pack(side='left', padx=(5, 0))
-
-        # Help text for key bindings
-        help_text = ttk.Label(details_frame, 
-                             text="Examples: 'a', 'space', 'enter', 'up', 'down', 'left', 'right', 'ctrl+c'",
-                             font=('Arial', 9), foreground='gray')
-        help_text.pack(pady=2)
-
-        # Hand type selection
-        hand_frame = ttk.Frame(details_frame)
-        hand_frame.pack(fill='x', pady=5)
-        ttk.Label(hand_frame, text="Hand Type:", width=15).pack(side='left')
-        self.hand_type_var = tk.StringVar(value="single")
-        hand_radio_frame = ttk.Frame(hand_frame)
-        hand_radio_frame.pack(side='left', padx=(5, 0))
-        ttk.Radiobutton(hand_radio_frame, text="Single Hand", 
-                       variable=self.hand_type_var, value="single").pack(side='left')
-        ttk.Radiobutton(hand_radio_frame, text="Both Hands", 
-                       variable=self.hand_type_var, value="both").pack(side='left', padx=(10, 0))
-
-        # Recording section
-        recording_frame = ttk.LabelFrame(parent, text="Record Gesture", padding=10)
-        recording_frame.pack(fill='x', padx=20, pady=10)
-
-        # Recording status
-        self.recording_status_label = ttk.Label(recording_frame, 
-                                               text="Ready to record gesture",
-                                               font=('Arial', 12))
-        self.recording_status_label.pack(pady=5)
-
-        # Recording button
-        self.record_button = ttk.Button(recording_frame, text="🔴 Start Recording",
-                                       command=self.start_gesture_recording_gui)
-        self.record_button.pack(pady=5)
-
-        # Instructions
-        instructions = ttk.Label(recording_frame,
-                               text="1. Enter gesture name and key binding\n2. Click 'Start Recording'\n3. Wait for countdown (3, 2, 1)\n4. Hold your gesture steady for 3 seconds",
-                               font=('Arial', 10), foreground='darkblue')
-        instructions.pack(pady=10)
-    
-    def create_template_gestures_section(self, parent):
-        """Create template gestures section"""
-        info_label = ttk.Label(parent, 
-                              text="Quick setup: Select a template gesture and record it",
-                              font=('Arial', 10), foreground='darkblue')
-        info_label.pack(pady=5)
-        
-        # Template gestures frame
-        template_gestures_frame = ttk.Frame(parent)
-        template_gestures_frame.pack(fill='both', expand=True, pady=5)
-        
-        # This will be populated when a profile is loaded
-        self.template_gestures_frame = template_gestures_frame
-        self.refresh_template_gestures()
-    
-    def refresh_template_gestures(self):
-        """Refresh template gestures display"""
-        # Clear existing widgets
-        for widget in self.template_gestures_frame.winfo_children():
-            widget.destroy()
-        
-        if not self.profile_manager.current_profile:
-            ttk.Label(self.template_gestures_frame, 
-                     text="Load a profile to see template gestures",
-                     font=('Arial', 10), foreground='gray').pack()
-            return
-        
-        template_gestures = self.profile_manager.get_template_gestures(self.profile_manager.current_profile)
-        
-        if not template_gestures:
-            ttk.Label(self.template_gestures_frame, 
-                     text="No template gestures available for this profile",
-                     font=('Arial', 10), foreground='gray').pack()
-            return
-        
-        # Create buttons for each template gesture
-        for gesture_name, gesture_info in template_gestures.items():
-            gesture_frame = ttk.Frame(self.template_gestures_frame)
-            gesture_frame.pack(fill='x', pady=2)
-            
-            # Gesture info
-            info_text = f"{gesture_name}: {gesture_info['key']} - {gesture_info['description']}"
-            ttk.Label(gesture_frame, text=info_text, width=50).pack(side='left')
-            
-            # Record button
-            ttk.Button(gesture_frame, text="🔴 Record",
-                      command=lambda gn=gesture_name, gi=gesture_info: self.record_template_gesture(gn, gi)).pack(side='right')
-    
-    def record_template_gesture(self, gesture_name: str, gesture_info: dict):
-        """Record a template gesture"""
-        if not self.profile_manager.current_profile:
-            messagebox.showerror("Error", "Please load a profile first")
-            return
-        
-        # Fill in the form with template data
-        self.gesture_name_entry.delete(0, tk.END)
-        self.gesture_name_entry.insert(0, gesture_name)
-        
-        self.key_binding_entry.delete(0, tk.END)
-        self.key_binding_entry.insert(0, gesture_info['key'])
-        
-        # Start recording
-        self.start_gesture_recording_gui()
-    
     def update_recording_status(self, message: str, color: str = 'black'):
         """Update recording status in GUI (thread-safe)"""
-        if hasattr(self, 'recording_status_label') and self.recording_status_label:
-            # Use after_idle to ensure GUI updates happen in main thread
-            if hasattr(self, 'root') and self.root:
-                self.root.after_idle(lambda: self._update_status_label(message, color))
-            elif hasattr(self, 'settings_window') and self.settings_window:
-                self.settings_window.after_idle(lambda: self._update_status_label(message, color))
-
-    def _update_status_label(self, message: str, color: str):
-        """Internal method to update status label (called from main thread)"""
-        if hasattr(self, 'recording_status_label') and self.recording_status_label:
-            try:
-                # Check if widget still exists
-                self.recording_status_label.winfo_exists()
-                self.recording_status_label.config(text=message, foreground=color)
-            except tk.TclError:
-                # Widget has been destroyed, ignore
-                pass
-            except Exception as e:
-                print(f"Warning: Could not update status label: {e}")
-    
-    def reset_recording_gui(self):
-        """Reset recording GUI elements (thread-safe)"""
-        if hasattr(self, 'root') and self.root:
-            self.root.after_idle(self._reset_gui_elements)
-        elif hasattr(self, 'settings_window') and self.settings_window:
-            self.settings_window.after_idle(self._reset_gui_elements)
-
-    def _reset_gui_elements(self):
-        """Internal method to reset GUI elements (called from main thread)"""
-        try:
-            if hasattr(self, 'record_button') and self.record_button:
-                self.record_button.winfo_exists()
-                self.record_button.config(state='normal', text="🔴 Record Gesture")
-        except tk.TclError:
-            pass
-        except Exception as e:
-            print(f"Warning: Could not reset record button: {e}")
-
-        try:
-            if hasattr(self, 'recording_status_label') and self.recording_status_label:
-                self.recording_status_label.winfo_exists()
-                self.recording_status_label.config(text="Ready to record gesture", foreground='black')
-        except tk.TclError:
-            pass
-        except Exception as e:
-            print(f"Warning: Could not reset status label: {e}")
-    
-    def start_gesture_recording_gui(self):
-        """Start gesture recording from GUI"""
-        if not self.profile_manager.current_profile:
-            messagebox.showerror("Error", "Please load a profile first")
+        if self.recording_status_label is None:
             return
 
-        gesture_name = self.gesture_name_entry.get().strip()
-        key_binding = self.key_binding_entry.get().strip()
+        # Only the newest status is shown; any older one still waiting is replaced
+        self._pending_status = (message, color)
 
-        if not gesture_name:
-            messagebox.showerror("Error", "Please enter a gesture name")
+        # Recorder timer threads must not call into Tk; the recording watcher picks their statuses up
+        if threading.current_thread() is not threading.main_thread() or self._status_after_id is not None:
             return
 
-        if not key_binding:
-            messagebox.showerror("Error", "Please enter a key binding")
-            return
-
-        # Check if gesture already exists
-        profile_data = self.profile_manager.get_current_profile_data()
-        if profile_data and gesture_name in profile_data.get('gestures', {}):
-            result = messagebox.askyesno("Gesture Exists", 
-                                       f"Gesture '{gesture_name}' already exists. Replace it?")
-            if not result:
-                return
-
-        hand_type = self.hand_type_var.get()
-        
-        # Update UI
-        self.record_button.config(state='disabled', text="🔴 Recording...")
-        
-        # Start recording session if not active
-        if not self.recording_session.current_profile:
-            self.recording_session.start_session(self.profile_manager.current_profile)
-        
-        # Start recording
-        self.recording_session.record_gesture(gesture_name, key_binding, hand_type)
-        
-        # Set up completion callback to reset GUI
-        def on_completion():
-            try:
-                self.reset_recording_gui()
-                self.refresh_gesture_list()
-                self.refresh_template_gestures()
-            except Exception as e:
-                print(f"Warning: Error in completion callback: {e}")
-
-        # Schedule GUI reset after recording completes (thread-safe)
-        if self.settings_window:
-            self.settings_window.after(7000, on_completion)  # 3s countdown + 3s recording + 1s buffer
+        window = self.root or self.settings_window
+        if window is not None:
+            self._status_after_id = window.after_idle(self._apply_pending_status)
 
-    def create_manage_gestures_tab_OLD(self, parent):
-        """Create manage gestures tab"""
-        # Title
-        title_label = ttk.Label(parent, text="📋 Manage Profile Gestures",
-                               font=('Arial', 16, 'bold'))
-        title_label.pack(pady=10)
-
-        # Current profile display
-        current_frame = ttk.Frame(parent)
-        current_frame.pack(fill='x', padx=20, pady=10)
-
-        ttk.Label(current_frame, text="Managing Profile:",
-                 font=('Arial', 12, 'bold')).pack(side='left')
-
-        self.manage_profile_label = ttk.Label(current_frame,
-                                             text=self.profile_manager.current_profile or "No profile selected",
-                                             font=('Arial', 12), foreground='blue')
-        self.manage_profile_label.pack(side='left', padx=(10, 0))
-
-        # Gestures list
-        list_frame = ttk.LabelFrame(parent, text="Profile Gestures", padding=10)
-        list_frame.pack(fill='both', expand=True, padx=20, pady=10)
-
-        # Create treeview for gestures
-        columns = ('Name', 'Key Binding', 'Status', 'Type')
-        self.gesture_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=10)
-
-        # Define headings
-        self.gesture_tree.heading('Name', text='Gesture Name')
-        self.gesture_tree.heading('Key Binding', text='Key Binding')
-        self.gesture_tree.heading('Status', text='Status')
-        self.gesture_tree.heading('Type', text='Hand Type')
-
-        # Configure column widths
-        self.gesture_tree.column('Name', width=150)
-        self.gesture_tree.column('Key Binding', width=100)
-        self.gesture_tree.column('Status', width=80)
-        self.gesture_tree.column('Type', width=100)
-
-        # Scrollbar for treeview
-        tree_scrollbar = ttk.Scrollbar(list_frame, orient='vertical',
-                                      command=self.gesture_tree.yview)
-        self.gesture_tree.configure(yscrollcommand=tree_scrollbar.set)
-
-        self.gesture_tree.pack(side='left', fill='both', expand=True)
-        tree_scrollbar.pack(side='right', fill='y')
-
-        # Management buttons
-        button_frame = ttk.Frame(parent)
-        button_frame.pack(pady=10)
-
-        ttk.Button(button_frame, text="✅ Activate",
-                  command=self.activate_selected_gesture).pack(side='left', padx=5)
-
-        ttk.Button(button_frame, text="❌ Deactivate",
-                  command=self.deactivate_selected_gesture).pack(side='left', padx=5)
-
-        ttk.Button(button_frame, text="✏️ Edit Binding",
-                  command=self.edit_gesture_binding).pack(side='left', padx=5)
-
-        ttk.Button(button_frame, text="🗑️ Delete",
-                  command=self.delete_selected_gesture).pack(side='left', padx=5)
-
-        ttk.Button(button_frame, text="🔄 Refresh",
-                  command=self.refresh_gesture_list).pack(side='left', padx=5)
-
-        # Initial refresh
-        self.refresh_gesture_list()
-
-    def create_new_profile_dialog(self):
-        """Create dialog for new profile creation"""
-        dialog = tk.Toplevel(self.settings_window)
-        dialog.title("Create New Profile")
-        dialog.geometry("400x300")
-        dialog.transient(self.settings_window)
-        dialog.grab_set()
-
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (400 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (300 // 2)
-        dialog.geometry(f"400x300+{x}+{y}")
-
-        # Profile name
-        ttk.Label(dialog, text="Profile Name:", font=('Arial', 12, 'bold')).pack(pady=10)
-        name_entry = ttk.Entry(dialog, width=30, font=('Arial', 12))
-        name_entry.pack(pady=5)
-
-        # Profile description
-        ttk.Label(dialog, text="Description:", font=('Arial', 12, 'bold')).pack(pady=(20, 5))
-        desc_text = tk.Text(dialog, width=40, height=5, font=('Arial', 10))
-        desc_text.pack(pady=5)
-
-        # Buttons
-        button_frame = ttk.Frame(dialog)
-        button_frame.pack(pady=20)
-
-        def create_profile():
-            name = name_entry.get().strip()
-            description = desc_text.get("1.0", tk.END).strip()
-
-            if not name:
-                messagebox.showerror("Error", "Please enter a profile name")
-                return
-
-            if name in self.profile_manager.get_profile_names():
-                messagebox.showerror("Error", "Profile name already exists")
-                return
-
-            if self.profile_manager.create_profile(name, description):
-                messagebox.showinfo("Success", f"Profile '{name}' created successfully!")
-                self.refresh_profile_list()
-                dialog.destroy()
-            else:
-                messagebox.showerror("Error", "Failed to create profile")
-
-        ttk.Button(button_frame, text="Create", command=create_profile).pack(side='left', padx=10)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side='left', padx=10)
-
-        name_entry.focus()
-
-    def create_template_profile(self, template_name):
-        """Create template profiles with predefined gestures"""
-        # Check if profile already exists
-        if template_name in self.profile_manager.get_profile_names():
-            result = messagebox.askyesno("Profile Exists",
-                                       f"Profile '{template_name}' already exists. Replace it?")
-            if not result:
-                return
-            self.profile_manager.delete_profile(template_name)
-
-        # Create the profile using the profile manager's template method
-        if self.profile_manager.create_template_profile(template_name):
-            messagebox.showinfo("Success", f"Template '{template_name}' created successfully!\n\n"
-                                         "Note: You'll need to record gestures for each action.")
-            self.refresh_profile_list()
-        else:
-            messagebox.showerror("Error", "Failed to create template profile")
-
-    def load_selected_profile(self):
-        """Load the selected profile from the list"""
-        selection = self.profile_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a profile to load")
-            return
-
-        profile_name = self.profile_listbox.get(selection[0])
-
-        if self.profile_manager.load_profile(profile_name):
-            messagebox.showinfo("Success", f"Profile '{profile_name}' loaded successfully!")
-            self.update_profile_labels()
-            self.refresh_gesture_list()
-            self.refresh_template_gestures()
-        else:
-            messagebox.showerror("Error", "Failed to load profile")
-
-    def delete_selected_profile(self):
-        """Delete the selected profile"""
-        selection = self.profile_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a profile to delete")
-            return
-
-        profile_name = self.profile_listbox.get(selection[0])
-
-        result = messagebox.askyesno("Confirm Delete",
-                                   f"Are you sure you want to delete profile '{profile_name}'?")
-        if result:
-            if self.profile_manager.delete_profile(profile_name):
-                messagebox.showinfo("Success", f"Profile '{profile_name}' deleted successfully!")
-                self.refresh_profile_list()
-                self.update_profile_labels()
-            else:
-                messagebox.showerror("Error", "Failed to delete profile")
-
-    def refresh_profile_list(self):
-        """Refresh the profile list"""
-        if self.profile_listbox:
-            self.profile_listbox.delete(0, tk.END)
-            for profile_name in self.profile_manager.get_profile_names():
-                self.profile_listbox.insert(tk.END, profile_name)
+    def _apply_pending_status(self):
+        """Show the newest pending recording status, if any (called from main thread)"""
+        self._status_after_id = None
+        pending, self._pending_status = self._pending_status, None
+        if pending is not None:
+            self._update_status_label(*pending)
 
+    def _update_status_label(self, message: str, color: str):
+        """Internal method to update status label (called from main thread)"""
+        status_label = self.recording_status_label
+        if status_label in self._live:
+            status_label.config(text=message, foreground=color)
+    
     def update_profile_labels(self):
         """Update profile labels in the UI"""
         current_profile = self.profile_manager.current_profile or "None Selected"
 
-        if hasattr(self, 'current_profile_label') and self.current_profile_label:
+        if self.current_profile_var is not None:
+            # Label follows the variable; its trace refreshes the status line
+            self.current_profile_var.set(current_profile)
+        elif self.current_profile_label is not None:
             self.current_profile_label.config(text=current_profile)
 
         # Update dropdown selection
-        if hasattr(self, 'profile_var') and self.profile_manager.current_profile:
+        if self.profile_var is not None and self.profile_manager.current_profile:
             self.profile_var.set(self.profile_manager.current_profile)
 
     def refresh_gesture_list(self):
-        """Refresh the gesture list"""
-        if not hasattr(self, 'gesture_tree') or not self.gesture_tree:
+        """Refresh the gesture list, touching only the rows that changed"""
+        if self.gesture_tree is None:
             return
 
-        # Clear existing items
-        for item in self.gesture_tree.get_children():
-            self.gesture_tree.delete(item)
+        # Rows belong to one tree; start over if the tree was rebuilt
+        if self._tree_owner is not self.gesture_tree:
+            self._tree_owner = self.gesture_tree
+            self._tree_state = {}
 
-        # Add gestures from current profile
+        # Rows for gestures in the current profile
+        new_rows = {}
         if self.profile_manager.current_profile:
-            profile_data = self.profile_manager.get_current_profile_data()
+            profile_data = self._get_current_profile_data_cached()
             if profile_data:
                 gestures = profile_data.get('gestures', {})
-                bindings = profile_data.get('bindings', {})
-
-                for gesture_name, gesture_data in gestures.items():
-                    key_binding = bindings.get(gesture_name, "Not set")
-                    hand_type = gesture_data.get('hand_type', 'single')
-                    hand_type_display = "👥 Both" if hand_type == "both" else "👤 Single"
-                    self.gesture_tree.insert('', 'end', values=(gesture_name, key_binding, hand_type_display))
+                binding_get = profile_data.get('bindings', {}).get
+                display_get = HAND_TYPE_DISPLAY.get
+                single_display = HAND_TYPE_DISPLAY['single']
+
+                new_rows = {gesture_name: (gesture_name, binding_get(gesture_name, "Not set"),
+                                           display_get(gesture_data.get('hand_type', 'single'), single_display))
+                            for gesture_name, gesture_data in gestures.items()}
+
+        tree_state = self._tree_state
+        to_delete = tree_state.keys() - new_rows.keys()
+        to_update = [name for name in tree_state.keys() & new_rows.keys()
+                     if tree_state[name] != new_rows[name]]
+
+        if to_delete:
+            self.gesture_tree.delete(*to_delete)
+            for name in to_delete:
+                del tree_state[name]
+
+        for name in to_update:
+            self.gesture_tree.item(name, values=new_rows[name])
+            tree_state[name] = new_rows[name]
+
+        to_insert = [name for name in new_rows if name not in tree_state]
+        bulk_insert = len(to_insert) > BULK_INSERT_THRESHOLD
+        if bulk_insert:
+            # No column layout per inserted row; columns come back once all rows are in
+            self.gesture_tree.configure(displaycolumns=())
+
+        for name in to_insert:
+            self.gesture_tree.insert('', 'end', iid=name, values=new_rows[name])
+            tree_state[name] = new_rows[name]
+
+        if bulk_insert:
+            self.gesture_tree.configure(displaycolumns='#all')
+
+        # Keep rows in profile order when kept rows and new rows interleave
+        ordered_names = tuple(new_rows)
+        if self.gesture_tree.get_children() != ordered_names:
+            for index, name in enumerate(ordered_names):
+                self.gesture_tree.move(name, '', index)
 
     # Individual gesture activation removed - now using profile-level activation
 
-    def edit_gesture_binding(self):
-        """Edit the key binding for selected gesture"""
+    def delete_selected_gesture(self):
+        """Delete the selected gesture"""
         selection = self.gesture_tree.selection()
         if not selection:
-            messagebox.showwarning("No Selection", "Please select a gesture to edit")
+            showwarning("No Selection", "Please select a gesture to delete")
             return
 
-        item = self.gesture_tree.item(selection[0])
-        gesture_name = item['values'][0]
-        current_binding = item['values'][1]
+        gesture_name = selection[0]  # rows are keyed by gesture name
+
+        profile_name = self.profile_manager.current_profile
+        profile_data = self._get_current_profile_data_cached()
+        if profile_data:
+            # Remove from all dictionaries, keeping what is needed to undo
+            gestures = profile_data.get('gestures')
+            gesture_data = gestures.pop(gesture_name, None) if gestures is not None else None
+            bindings = profile_data.get('bindings')
+            key_binding = bindings.pop(gesture_name, None) if bindings is not None else None
+            active_gestures = profile_data.get('active_gestures')
+            was_active = False
+            if active_gestures:
+                # One scan of the list: remove() finds the name or raises
+                try:
+                    active_gestures.remove(gesture_name)
+                    was_active = True
+                except ValueError:
+                    pass
 
-        new_binding = simpledialog.askstring("Edit Key Binding",
-                                            f"Enter new key binding for '{gesture_name}':",
-                                            initialvalue=current_binding)
+            self._mark_dirty(profile_name)
+            self._schedule_refresh('gestures')
 
-        if new_binding:
-            profile_data = self.profile_manager.get_current_profile_data()
-            if profile_data:
-                profile_data.setdefault('bindings', {})[gesture_name] = new_binding
-                self.profile_manager.save_profile(self.profile_manager.current_profile, profile_data)
-                self.refresh_gesture_list()
-                messagebox.showinfo("Success", f"Key binding updated for '{gesture_name}'")
+            def undo_delete():
+                if profile_name not in self.profile_manager.profiles:
+                    return
+                restored_data = self.profile_manager.get_profile_data(profile_name)
+                if gesture_data is not None:
+                    restored_data.setdefault('gestures', {})[gesture_name] = gesture_data
+                if key_binding is not None:
+                    restored_data.setdefault('bindings', {})[gesture_name] = key_binding
+                if was_active:
+                    restored_data.setdefault('active_gestures', []).append(gesture_name)
+                self._mark_dirty(profile_name)
+                self._invalidate_profile_cache()
+                self._schedule_refresh('gestures')
+                self.update_status()
 
-    def delete_selected_gesture(self):
-        """Delete the selected gesture"""
-        selection = self.gesture_tree.selection()
-        if not selection:
-            messagebox.showwarning("No Selection", "Please select a gesture to delete")
-            return
+            self._show_notification(f"🗑️ Deleted gesture '{gesture_name}'", undo=undo_delete)
 
-        item = self.gesture_tree.item(selection[0])
-        gesture_name = item['values'][0]
+    def _mark_dirty(self, profile_name):
+        """Save a profile edited in memory shortly, so a quick run of edits is written once"""
+        self.profile_manager.mark_profile_changed(profile_name)
+        self._dirty_profiles.add(profile_name)
 
-        result = messagebox.askyesno("Confirm Delete",
-                                   f"Are you sure you want to delete gesture '{gesture_name}'?")
-        if result:
-            profile_data = self.profile_manager.get_current_profile_data()
-            if profile_data:
-                # Remove from all dictionaries
-                profile_data.get('gestures', {}).pop(gesture_name, None)
-                profile_data.get('bindings', {}).pop(gesture_name, None)
-                active_gestures = profile_data.get('active_gestures', [])
-                if gesture_name in active_gestures:
-                    active_gestures.remove(gesture_name)
+        window = self.root or self.settings_window
+        if window is None:
+            self._flush_profile_save()
+            return
 
-                self.profile_manager.save_profile(self.profile_manager.current_profile, profile_data)
-                self.refresh_gesture_list()
-                messagebox.showinfo("Success", f"Gesture '{gesture_name}' deleted")
+        if self._save_after_id is not None:
+            window.after_cancel(self._save_after_id)
+        self._save_after_id = window.after(SAVE_DEBOUNCE_MS, self._flush_profile_save)
+
+    def _discard_pending_save(self, profile_name):
+        """Forget unsaved edits to a profile, cancelling the flush timer if nothing else is waiting"""
+        self._dirty_profiles.discard(profile_name)
+        if not self._dirty_profiles and self._save_after_id is not None:
+            window = self.root or self.settings_window
+            if window is not None:
+                window.after_cancel(self._save_after_id)
+            self._save_after_id = None
+
+    def _flush_profile_save(self, wait=False):
+        """Write pending gesture edits on the I/O worker now (wait=True returns once written, before a reload from disk)"""
+        if self._save_after_id is not None:
+            window = self.root or self.settings_window
+            if window is not None:
+                window.after_cancel(self._save_after_id)
+            self._save_after_id = None
+
+        dirty_profiles, self._dirty_profiles = self._dirty_profiles, set()
+        for profile_name in dirty_profiles:
+            if profile_name in self.profile_manager.profiles:
+                self._save_profile_snapshot(profile_name, self.profile_manager.get_profile_data(profile_name),
+                                            partial(self._on_flush_saved, profile_name))
+
+        if wait:
+            # The worker runs jobs in order, so this returns once every queued save is written
+            self._io_pool.submit(lambda: None).result()
+
+    def _on_flush_saved(self, profile_name, saved, error):
+        """Report a debounced save that did not reach the disk"""
+        if not saved:
+            print(f"❌ Failed to save profile '{profile_name}'")
+
+    def _show_notification(self, message, undo=None):
+        """Show a message along the bottom of the settings window for a few seconds, with an optional Undo"""
+        if self.settings_window is None:
+            showinfo("Success", message)
+            return
+
+        if self._notification_bar not in self._live:
+            self._notification_bar = ttk.Frame(self.settings_window, padding=5)
+            self._notification_label = ttk.Label(self._notification_bar, font=_font(10))
+            self._notification_label.pack(side='left')
+            self._notification_undo_button = ttk.Button(self._notification_bar, text="Undo",
+                                                        command=self._undo_notification)
+            self._track_live(self._notification_bar)
+
+        if self._notification_after_id is not None:
+            self.settings_window.after_cancel(self._notification_after_id)
+
+        self._notification_undo = undo
+        self._notification_label.config(text=message)
+        if undo is not None:
+            self._notification_undo_button.pack(side='right')
+        else:
+            self._notification_undo_button.pack_forget()
+
+        # Placed over the bottom edge so showing and hiding it never relayouts the window
+        self._notification_bar.place(relx=0, rely=1, relwidth=1, anchor='sw')
+        self._notification_bar.lift()
+        self._notification_after_id = self.settings_window.after(NOTIFICATION_DURATION_MS,
+                                                                 self._hide_notification)
+
+    def _hide_notification(self):
+        """Hide the notification bar; its Undo is no longer offered"""
+        self._notification_after_id = None
+        self._notification_undo = None
+        if self._notification_bar in self._live:
+            self._notification_bar.place_forget()
+
+    def _undo_notification(self):
+        """Run the Undo action offered by the notification bar"""
+        undo = self._notification_undo
+        if self._notification_after_id is not None and self.settings_window is not None:
+            self.settings_window.after_cancel(self._notification_after_id)
+        self._hide_notification()
+        if undo is not None:
+            undo()
 
     def close_settings_window(self):
         """Close the settings window"""
+        self._flush_profile_save()
         self.settings_open = False
         if self.settings_window:
             self.settings_window.destroy()
@@ -1288,17 +1370,15 @@ class GestureSettingsGUI:
 
     def update_tkinter(self):
         """Update tkinter GUI (thread-safe)"""
-        if hasattr(self, 'root') and self.root:
+        if self.root is not None:
             try:
-                # Only update if we're in the main thread
-                self.root.update_idletasks()
+                # One update() pass handles pending events and redraws for every window,
+                # the settings window included, so no separate update_idletasks() calls are needed
                 self.root.update()
             except Exception as e:
                 # Silently handle GUI update errors to prevent crashes
                 pass
-
-        # Also update settings window if open
-        if hasattr(self, 'settings_window') and self.settings_window:
+        elif self.settings_open and self.settings_window is not None:
             try:
                 self.settings_window.update_idletasks()
             except Exception as e:
@@ -1306,7 +1386,11 @@ class GestureSettingsGUI:
 
     def cleanup(self):
         """Cleanup GUI resources"""
-        if hasattr(self, 'root') and self.root:
+        # Write pending gesture edits and let any pending profile saves finish before exiting
+        self._flush_profile_save()
+        self._io_pool.shutdown(wait=True)
+
+        if self.root is not None:
             try:
                 self.root.destroy()
             except:
@@ -6,17 +6,142 @@ Handles creation, loading, saving, and management of gesture profiles
 
 import json
 import os
+import stat
+import logging
+import hashlib
+import functools
+import tempfile
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+# The process umask, read once (os.umask can only be read by setting it); mkstemp files are owner-only,
+# so rewritten profile files get the mode open() would have given them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Sidecar file in the profiles directory holding each profile file's stamp and basic info,
+# so startup can list unchanged profiles without parsing them
+PROFILE_INDEX_FILENAME = '.profile_index'
+
+
+# Lower-cases ASCII letters and turns spaces into underscores in a single pass
+_FILENAME_TABLE = str.maketrans({' ': '_', **{chr(c): chr(c + 32) for c in range(ord('A'), ord('Z') + 1)}})
+
+
+def _profile_file_stem(name: str) -> str:
+    """Derive a profile's file name (without .json) from its name"""
+    if name.isascii():
+        return name.translate(_FILENAME_TABLE)
+    # Non-ASCII names need full Unicode lower-casing
+    return name.lower().replace(' ', '_')
+
+
+def _dump_json(data) -> bytes:
+    """Serialize profile data to indented JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _load_json(raw_bytes: bytes):
+    """Parse profile JSON bytes (orjson when available)"""
+    return orjson.loads(raw_bytes) if ORJSON_AVAILABLE else json.loads(raw_bytes)
+
+
+def _freeze(mapping: dict):
+    """Wrap a nested dict literal in read-only mapping proxies"""
+    return MappingProxyType({key: _freeze(value) if isinstance(value, dict) else value
+                             for key, value in mapping.items()})
+
+
+# Built-in profile templates, built once and shared read-only; create_template_profile copies what it stores
+_TEMPLATES = _freeze({
+    "Racing Game": {
+        "description": "Profile for racing games with directional controls",
+        "template_gestures": {
+            "accelerate": {"key": "up", "description": "Accelerate"},
+            "brake": {"key": "down", "description": "Brake/Reverse"},
+            "turn_left": {"key": "left", "description": "Turn Left"},
+            "turn_right": {"key": "right", "description": "Turn Right"},
+            "nitro": {"key": "space", "description": "Nitro Boost"},
+            "horn": {"key": "h", "description": "Horn"}
+        }
+    },
+    "Video Player": {
+        "description": "Profile for video player controls",
+        "template_gestures": {
+            "play_pause": {"key": "space", "description": "Play/Pause"},
+            "volume_up": {"key": "up", "description": "Volume Up"},
+            "volume_down": {"key": "down", "description": "Volume Down"},
+            "seek_forward": {"key": "right", "description": "Seek Forward"},
+            "seek_backward": {"key": "left", "description": "Seek Backward"},
+            "fullscreen": {"key": "f", "description": "Toggle Fullscreen"}
+        }
+    },
+    "General Gaming": {
+        "description": "General gaming profile with common controls",
+        "template_gestures": {
+            "jump": {"key": "space", "description": "Jump"},
+            "move_forward": {"key": "w", "description": "Move Forward"},
+            "move_backward": {"key": "s", "description": "Move Backward"},
+            "move_left": {"key": "a", "description": "Move Left"},
+            "move_right": {"key": "d", "description": "Move Right"},
+            "action": {"key": "e", "description": "Action/Interact"}
+        }
+    }
+})
+
+def _locked(method):
+    """Run a GestureProfileManager method while holding the manager's lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class ProfileEntry:
+    """One known profile: its file, its parsed data (None until first used) and lookups cached from it"""
+    __slots__ = ('filepath', 'data', 'basic_info', 'file_stamp', 'digest', 'saved_content',
+                 'active_set', 'binding_index')
+
+    def __init__(self, filepath: str, data: Optional[dict], basic_info: dict, file_stamp=None):
+        self.filepath = filepath
+        self.data = data
+        self.basic_info = basic_info
+        self.file_stamp = file_stamp  # (mtime_ns, size) of the file when data was read or written
+        self.digest = None  # digest of the raw bytes load_profile parsed, None once data changes
+        self.saved_content = None  # (file stamp, content hash) of the last load or save
+        self.active_set = frozenset()
+        self.binding_index = {}
+
 
 class GestureProfileManager:
     """Manages gesture profiles and collections"""
     
     def __init__(self):
+        # Profiles are loaded and saved from the GUI's I/O worker while the Tk thread and the
+        # camera loop read and edit them, so public methods hold this (reentrant) lock
+        self._lock = threading.RLock()
         self.profiles_dir = "gesture_profiles"
         self.current_profile = None
         self.profiles = {}
+        self._names_cache = None  # list of profile names, rebuilt after profiles are added or removed
+        self._parse_cache = {}  # filepath -> (file stamp, parsed data) matching what is on disk
+        self._basic_info_cache = None  # name -> basic info for all profiles, rebuilt after profiles change
+        self.version = 0  # bumped on every change to profile data, so readers can tell when their caches are stale
         self.ensure_profiles_directory()
         self.load_all_profiles()
     
@@ -24,10 +149,11 @@ class GestureProfileManager:
         """Create profiles directory if it doesn't exist"""
         if not os.path.exists(self.profiles_dir):
             os.makedirs(self.profiles_dir)
-            print(f"📁 Created profiles directory: {self.profiles_dir}")
+            log.info("📁 Created profiles directory: %s", self.profiles_dir)
     
-    def create_profile(self, name: str, description: str = ""):
-        """Create a new gesture profile"""
+    @_locked
+    def create_profile(self, name: str, description: str = "", initial_data: Optional[dict] = None):
+        """Create a new gesture profile, merging initial_data into it before it is first written"""
         profile = {
             'name': name,
             'description': description,
@@ -37,237 +163,481 @@ class GestureProfileManager:
             'created_at': time.time(),
             'modified_at': time.time()
         }
+        if initial_data:
+            profile.update(initial_data)
         
-        filename = f"{name.lower().replace(' ', '_')}.json"
+        filename = f"{_profile_file_stem(name)}.json"
         filepath = os.path.join(self.profiles_dir, filename)
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(profile, f, indent=2)
+            self._write_profile_file(filepath, profile)
             
-            self.profiles[name] = {
-                'data': profile,
-                'filepath': filepath
-            }
+            self.profiles[name] = ProfileEntry(filepath, profile, self._build_basic_info(name, profile))
+            self._names_cache = None
+            self._basic_info_cache = None
+            self._refresh_derived_state(name)
+            self.version += 1
             
-            print(f"✅ Created profile: {name}")
+            log.debug("✅ Created profile: %s", name)
             return True
         except Exception as e:
-            print(f"❌ Error creating profile: {e}")
+            log.error("❌ Error creating profile: %s", e)
             return False
     
+    @_locked
     def load_profile(self, name: str):
         """Load a specific profile and clear any previous profile data"""
         if name in self.profiles:
             try:
-                # Clear current profile first to avoid mixing data
-                self.current_profile = None
-
-                # Load fresh data from file
-                with open(self.profiles[name]['filepath'], 'r') as f:
-                    profile_data = json.load(f)
+                # Load fresh data from file; current_profile keeps naming the previous profile
+                # until this one is loaded, so readers outside the lock never see it unset mid-load
+                profile_info = self.profiles[name]
+                raw_bytes, file_stamp = self._read_file(profile_info.filepath)
+                profile_data = _load_json(raw_bytes)
 
-                # Update cache with fresh data
-                self.profiles[name]['data'] = profile_data
+                # Update cache with fresh data and remember which file contents it came from
+                profile_info.data = profile_data
+                profile_info.digest = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+                profile_info.file_stamp = file_stamp
+                self._parse_cache[profile_info.filepath] = (file_stamp, profile_data)
+                profile_info.saved_content = (file_stamp, self._content_hash(profile_data))
+                self._refresh_derived_state(name)
+                self.version += 1
 
                 # Set as current profile only after successful load
                 self.current_profile = name
 
-                print(f"✅ Loaded profile: {name}")
-                print(f"📊 Profile contains {len(profile_data.get('gestures', {}))} gestures")
+                log.debug("✅ Loaded profile: %s", name)
+                log.debug("📊 Profile contains %d gestures", len(profile_data.get('gestures', {})))
 
                 return profile_data
             except Exception as e:
-                print(f"❌ Error loading profile: {e}")
+                log.error("❌ Error loading profile: %s", e)
                 self.current_profile = None
                 return None
         return None
     
-    def save_profile(self, name: str, profile_data: dict):
-        """Save profile data"""
+    @_locked
+    def save_profile(self, name: str, profile_data: dict, snapshot: bool = False):
+        """Save profile data (a snapshot copy is written without replacing the profile's data in memory)"""
+        # The caller may have edited the data in place, so it is a new version even if the write fails
+        self.version += 1
         if name in self.profiles:
             try:
+                # Skip the write if the file is untouched since it was last read or written
+                # and the data (ignoring modified_at) is what it already holds
+                profile_info = self.profiles[name]
+                content_hash = self._content_hash(profile_data)
+                saved_content = profile_info.saved_content
+                if (saved_content is not None and saved_content[1] == content_hash
+                        and saved_content[0] == self._file_stamp(profile_info.filepath)):
+                    if not snapshot:
+                        profile_info.data = profile_data
+                    profile_info.file_stamp = saved_content[0]
+                    self._parse_cache[profile_info.filepath] = (saved_content[0], profile_data)
+                    self._refresh_derived_state(name)
+                    log.debug("✅ Profile unchanged, nothing to save: %s", name)
+                    return True
+
                 profile_data['modified_at'] = time.time()
                 
-                with open(self.profiles[name]['filepath'], 'w') as f:
-                    json.dump(profile_data, f, indent=2)
+                self._write_profile_file(profile_info.filepath, profile_data)
                 
-                self.profiles[name]['data'] = profile_data
-                print(f"✅ Saved profile: {name}")
+                if not snapshot:
+                    profile_info.data = profile_data
+                profile_info.basic_info = self._build_basic_info(name, profile_data)
+                self._basic_info_cache = None
+                profile_info.digest = None
+                profile_info.file_stamp = self._file_stamp(profile_info.filepath)
+                self._parse_cache[profile_info.filepath] = (profile_info.file_stamp, profile_data)
+                profile_info.saved_content = (profile_info.file_stamp, content_hash)
+                self._refresh_derived_state(name)
+                log.debug("✅ Saved profile: %s", name)
                 return True
             except Exception as e:
-                print(f"❌ Error saving profile: {e}")
+                log.error("❌ Error saving profile: %s", e)
                 return False
         return False
     
+    @_locked
+    def mark_profile_changed(self, name: str):
+        """Refresh cached lookups after a profile's data was edited in memory (saved later with save_profile)"""
+        if name in self.profiles:
+            # The in-memory data no longer matches the file until it is saved
+            profile_info = self.profiles[name]
+            profile_info.digest = None
+            profile_info.file_stamp = None
+            self._parse_cache.pop(profile_info.filepath, None)
+            self._refresh_derived_state(name)
+
+        # Readers such as the recognition engine's match caches must see the edit before it is saved
+        self.version += 1
+
+    @_locked
     def load_all_profiles(self):
-        """Load all available profiles with basic info for fast access"""
+        """Load basic info for all available profiles; profile bodies are parsed on first use"""
         self.profiles = {}
+        self.version += 1
+        self._names_cache = None
+        self._basic_info_cache = None
 
-        if not os.path.exists(self.profiles_dir):
+        # scandir entries carry their own stat info, so each file is stat'ed once
+        try:
+            with os.scandir(self.profiles_dir) as it:
+                entries = [entry for entry in it if entry.name.endswith('.json') and entry.is_file()]
+        except FileNotFoundError:
             return
 
-        for filename in os.listdir(self.profiles_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.profiles_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        profile_data = json.load(f)
+        index = self._read_profile_index()
+        new_index = {}
+
+        # Work out where each file's data comes from before reading anything
+        sources = []
+        for entry in entries:
+            try:
+                file_stat = entry.stat()
+                file_stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+                cached = self._parse_cache.get(entry.path)
+                indexed = index.get(entry.name)
+                if cached is not None and cached[0] == file_stamp:
+                    # Already parsed and unchanged since it was last read or written
+                    source = 'cache'
+                elif self._valid_index_entry(indexed, file_stamp):
+                    # Unchanged since it was indexed: list it now, parse it when it is first used
+                    source = 'index'
+                else:
+                    source = 'file'
+                sources.append((entry.name, entry.path, file_stamp, source))
+            except Exception as e:
+                log.warning("⚠️  Error loading profile %s: %s", entry.name, e)
+
+        # Read and parse the new or changed files concurrently to overlap their open/read latency
+        to_parse = [filepath for _, filepath, _, source in sources if source == 'file']
+        parsed = {}
+        if to_parse:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_parse))) as executor:
+                parsed = dict(zip(to_parse, executor.map(self._read_profile_file, to_parse)))
 
+        for filename, filepath, file_stamp, source in sources:
+            try:
+                if source == 'cache':
+                    profile_data = self._parse_cache[filepath][1]
+                elif source == 'index':
+                    profile_data = None
+                else:
+                    profile_data, error = parsed[filepath]
+                    if error is not None:
+                        raise error
+                    self._parse_cache[filepath] = (file_stamp, profile_data)
+
+                if profile_data is None:
+                    profile_name = index[filename]['name']
+                    basic_info = index[filename]['basic_info']
+                else:
                     profile_name = profile_data.get('name', filename[:-5])
+                    basic_info = self._build_basic_info(profile_name, profile_data)
 
-                    # Store full data and basic info for quick access
-                    self.profiles[profile_name] = {
-                        'data': profile_data,
-                        'filepath': filepath,
-                        'basic_info': {
-                            'name': profile_name,
-                            'gesture_count': len(profile_data.get('gestures', {})),
-                            'description': profile_data.get('description', ''),
-                            'created_at': profile_data.get('created_at', 0),
-                            'modified_at': profile_data.get('modified_at', 0)
-                        }
-                    }
-                except Exception as e:
-                    print(f"⚠️  Error loading profile {filename}: {e}")
+                # Store basic info for quick access; data stays None until the profile is used
+                self.profiles[profile_name] = ProfileEntry(filepath, profile_data, basic_info, file_stamp)
+                if profile_data is not None:
+                    self._refresh_derived_state(profile_name)
+                new_index[filename] = {'stamp': list(file_stamp), 'name': profile_name, 'basic_info': basic_info}
+            except Exception as e:
+                log.warning("⚠️  Error loading profile %s: %s", filename, e)
+
+        if new_index != index:
+            self._write_profile_index(new_index)
 
-        print(f"📁 Loaded {len(self.profiles)} profiles")
+        log.info("📁 Loaded %d profiles", len(self.profiles))
     
+    @_locked
     def delete_profile(self, name: str):
         """Delete a profile"""
         if name in self.profiles:
             try:
-                os.remove(self.profiles[name]['filepath'])
+                filepath = self.profiles[name].filepath
+                os.remove(filepath)
+                self._parse_cache.pop(filepath, None)
                 del self.profiles[name]
+                self.version += 1
+                self._names_cache = None
+                self._basic_info_cache = None
                 
                 if self.current_profile == name:
                     self.current_profile = None
                 
-                print(f"🗑️  Deleted profile: {name}")
+                log.debug("🗑️  Deleted profile: %s", name)
                 return True
             except Exception as e:
-                print(f"❌ Error deleting profile: {e}")
+                log.error("❌ Error deleting profile: %s", e)
                 return False
         return False
     
+    @_locked
     def get_profile_names(self):
-        """Get list of all profile names"""
-        return list(self.profiles.keys())
+        """Get list of all profile names (cached; callers must not modify it)"""
+        if self._names_cache is None:
+            self._names_cache = list(self.profiles.keys())
+        return self._names_cache
     
+    @_locked
     def get_current_profile_data(self, force_reload=False):
         """Get current profile data"""
         if self.current_profile and self.current_profile in self.profiles:
             # Force reload from file to ensure we have the latest data
             if force_reload:
                 try:
-                    with open(self.profiles[self.current_profile]['filepath'], 'r') as f:
-                        fresh_data = json.load(f)
-                    self.profiles[self.current_profile]['data'] = fresh_data
+                    profile_info = self.profiles[self.current_profile]
+                    file_stamp = self._file_stamp(profile_info.filepath)
+                    if file_stamp == profile_info.file_stamp:
+                        # File is unchanged since we last read or wrote it
+                        return self.get_profile_data(self.current_profile)
+
+                    raw_bytes, file_stamp = self._read_file(profile_info.filepath)
+                    fresh_data = _load_json(raw_bytes)
+                    profile_info.data = fresh_data
+                    profile_info.digest = None
+                    profile_info.file_stamp = file_stamp
+                    self._parse_cache[profile_info.filepath] = (file_stamp, fresh_data)
+                    self._refresh_derived_state(self.current_profile)
+                    self.version += 1
                     return fresh_data
                 except Exception as e:
-                    print(f"Warning: Could not reload profile data: {e}")
+                    log.warning("Warning: Could not reload profile data: %s", e)
 
-            return self.profiles[self.current_profile]['data']
+            return self.get_profile_data(self.current_profile)
         return None
 
+    @_locked
+    def get_profile_data(self, name: str):
+        """Get a profile's data, parsing its file the first time it is needed"""
+        if name not in self.profiles:
+            return None
+
+        profile_info = self.profiles[name]
+        if profile_info.data is None:
+            try:
+                raw_bytes, file_stamp = self._read_file(profile_info.filepath)
+                profile_data = _load_json(raw_bytes)
+                profile_info.data = profile_data
+                profile_info.file_stamp = file_stamp
+                self._parse_cache[profile_info.filepath] = (file_stamp, profile_data)
+                self._refresh_derived_state(name)
+                self.version += 1
+            except Exception as e:
+                log.error("❌ Error reading profile %s: %s", name, e)
+        return profile_info.data
+
+    @_locked
+    def get_active_gestures(self, profile_name: Optional[str] = None):
+        """Get active gesture names as a frozenset (defaults to the current profile)"""
+        profile_name = profile_name or self.current_profile
+        if profile_name in self.profiles:
+            if self.profiles[profile_name].data is None:
+                self.get_profile_data(profile_name)
+            return self.profiles[profile_name].active_set
+        return frozenset()
+
+    @_locked
+    def get_binding_index(self, profile_name: Optional[str] = None):
+        """Get a key -> [gesture names] index of bindings (defaults to the current profile)"""
+        profile_name = profile_name or self.current_profile
+        if profile_name in self.profiles:
+            if self.profiles[profile_name].data is None:
+                self.get_profile_data(profile_name)
+            return self.profiles[profile_name].binding_index
+        return {}
+
+    @staticmethod
+    def _file_stamp(filepath: str):
+        """Get (mtime_ns, size) for a profile file, used to tell whether it changed on disk"""
+        file_stat = os.stat(filepath)
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    @staticmethod
+    def _write_profile_file(filepath: str, profile_data: dict):
+        """Write a profile file atomically: serialize once, write a temp file, then rename it over the old one"""
+        data = memoryview(_dump_json(profile_data))
+        # A uniquely named temp file per write, so concurrent saves of one profile never share it
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(filepath) + '.', suffix='.tmp',
+                                        dir=os.path.dirname(filepath) or '.')
+        try:
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            os.chmod(tmp_path, GestureProfileManager._new_file_mode(filepath))
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _new_file_mode(filepath: str):
+        """Get the mode for a rewritten file: the existing file's mode, or what open() would give a new one"""
+        try:
+            return stat.S_IMODE(os.stat(filepath).st_mode)
+        except FileNotFoundError:
+            return 0o666 & ~_UMASK
+
+    @staticmethod
+    def _read_file(filepath: str):
+        """Read a whole file with one read sized from fstat, returning (bytes, (mtime_ns, size)) for that open file"""
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            file_stat = os.fstat(fd)
+            # Ask for one byte more than the size so a single read also sees end of file
+            chunks = [os.read(fd, file_stat.st_size + 1)]
+            if len(chunks[0]) > file_stat.st_size:
+                # The file grew since the fstat; read the rest
+                chunks.extend(iter(lambda: os.read(fd, 1 << 16), b''))
+            return b''.join(chunks), (file_stat.st_mtime_ns, file_stat.st_size)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _read_profile_file(filepath: str):
+        """Read and parse one profile file, returning (data, error) instead of raising"""
+        try:
+            return _load_json(GestureProfileManager._read_file(filepath)[0]), None
+        except Exception as e:
+            return None, e
+
+    def _read_profile_index(self):
+        """Read the profile index sidecar file, or an empty index if it is missing or unreadable"""
+        try:
+            index = _load_json(self._read_file(os.path.join(self.profiles_dir, PROFILE_INDEX_FILENAME))[0])
+            return index if isinstance(index, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            log.warning("⚠️  Ignoring unreadable profile index: %s", e)
+            return {}
+
+    @staticmethod
+    def _valid_index_entry(entry, file_stamp):
+        """Check that a profile index entry is well formed and matches the file's current stamp"""
+        if not isinstance(entry, dict) or entry.get('stamp') != list(file_stamp):
+            return False
+
+        name = entry.get('name')
+        basic_info = entry.get('basic_info')
+        if not isinstance(name, str) or not name or not isinstance(basic_info, dict):
+            return False
+
+        number = (int, float)
+        return (basic_info.get('name') == name
+                and type(basic_info.get('gesture_count')) is int and basic_info['gesture_count'] >= 0
+                and isinstance(basic_info.get('description'), str)
+                and isinstance(basic_info.get('created_at'), number)
+                and isinstance(basic_info.get('modified_at'), number))
+
+    def _write_profile_index(self, index: dict):
+        """Write the profile index sidecar file"""
+        try:
+            self._write_profile_file(os.path.join(self.profiles_dir, PROFILE_INDEX_FILENAME), index)
+        except Exception as e:
+            log.warning("⚠️  Could not write profile index: %s", e)
+
+    @staticmethod
+    def _content_hash(profile_data: dict):
+        """Digest profile data with sorted keys, leaving out modified_at, to tell whether a save changes anything"""
+        content = {key: value for key, value in profile_data.items() if key != 'modified_at'}
+        if ORJSON_AVAILABLE:
+            raw_bytes = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+        else:
+            raw_bytes = json.dumps(content, sort_keys=True).encode('utf-8')
+        return hashlib.blake2b(raw_bytes, digest_size=16).digest()
+
+    @staticmethod
+    def _build_basic_info(name: str, profile_data: dict):
+        """Build the basic info shown in profile lists"""
+        return {
+            'name': name,
+            'gesture_count': len(profile_data.get('gestures', {})),
+            'description': profile_data.get('description', ''),
+            'created_at': profile_data.get('created_at', 0),
+            'modified_at': profile_data.get('modified_at', 0)
+        }
+
+    def _refresh_derived_state(self, name: str):
+        """Rebuild the cached active gesture set and binding index after the profile data changes"""
+        profile_data = self.profiles[name].data
+        self.profiles[name].active_set = frozenset(profile_data.get('active_gestures', []))
+
+        binding_index = defaultdict(list)
+        for gesture_name, key_binding in profile_data.get('bindings', {}).items():
+            binding_index[key_binding].append(gesture_name)
+        self.profiles[name].binding_index = binding_index
+
+    @_locked
     def reload_current_profile_from_disk(self):
         """Force reload current profile from disk to ensure fresh data"""
         if self.current_profile:
-            print(f"🔄 Reloading profile '{self.current_profile}' from disk...")
+            log.debug("🔄 Reloading profile '%s' from disk...", self.current_profile)
             return self.get_current_profile_data(force_reload=True)
         return None
     
+    @_locked
     def create_template_profile(self, template_name: str):
         """Create template profiles with predefined gesture structures"""
-        templates = {
-            "Racing Game": {
-                "description": "Profile for racing games with directional controls",
-                "template_gestures": {
-                    "accelerate": {"key": "up", "description": "Accelerate"},
-                    "brake": {"key": "down", "description": "Brake/Reverse"},
-                    "turn_left": {"key": "left", "description": "Turn Left"},
-                    "turn_right": {"key": "right", "description": "Turn Right"},
-                    "nitro": {"key": "space", "description": "Nitro Boost"},
-                    "horn": {"key": "h", "description": "Horn"}
-                }
-            },
-            "Video Player": {
-                "description": "Profile for video player controls",
-                "template_gestures": {
-                    "play_pause": {"key": "space", "description": "Play/Pause"},
-                    "volume_up": {"key": "up", "description": "Volume Up"},
-                    "volume_down": {"key": "down", "description": "Volume Down"},
-                    "seek_forward": {"key": "right", "description": "Seek Forward"},
-                    "seek_backward": {"key": "left", "description": "Seek Backward"},
-                    "fullscreen": {"key": "f", "description": "Toggle Fullscreen"}
-                }
-            },
-            "General Gaming": {
-                "description": "General gaming profile with common controls",
-                "template_gestures": {
-                    "jump": {"key": "space", "description": "Jump"},
-                    "move_forward": {"key": "w", "description": "Move Forward"},
-                    "move_backward": {"key": "s", "description": "Move Backward"},
-                    "move_left": {"key": "a", "description": "Move Left"},
-                    "move_right": {"key": "d", "description": "Move Right"},
-                    "action": {"key": "e", "description": "Action/Interact"}
-                }
-            }
-        }
-        
-        if template_name not in templates:
+        template = _TEMPLATES.get(template_name)
+        if template is None:
             return False
         
-        template = templates[template_name]
-        
-        # Create the profile
-        if self.create_profile(template_name, template["description"]):
-            # Add template gesture placeholders
-            profile_data = self.get_current_profile_data()
-            if profile_data:
-                profile_data['template_gestures'] = template["template_gestures"]
-                self.save_profile(template_name, profile_data)
-            return True
-        
-        return False
+        # Create the profile with its template gesture placeholders in a single write
+        template_gestures = {gesture_name: dict(gesture_info)
+                             for gesture_name, gesture_info in template["template_gestures"].items()}
+        return self.create_profile(template_name, template["description"],
+                                   initial_data={'template_gestures': template_gestures})
     
+    @_locked
     def get_template_gestures(self, profile_name: str):
         """Get template gestures for a profile"""
-        if profile_name in self.profiles:
-            profile_data = self.profiles[profile_name]['data']
+        profile_data = self.get_profile_data(profile_name)
+        if profile_data:
             return profile_data.get('template_gestures', {})
         return {}
 
+    @_locked
     def get_profile_basic_info(self, profile_name: str):
         """Get basic profile info without loading full data"""
         if profile_name in self.profiles:
-            return self.profiles[profile_name].get('basic_info', {})
+            return self.profiles[profile_name].basic_info
         return {}
 
+    @_locked
     def get_all_profiles_basic_info(self):
-        """Get basic info for all profiles"""
-        basic_info = {}
-        for profile_name, profile_info in self.profiles.items():
-            basic_info[profile_name] = profile_info.get('basic_info', {})
-        return basic_info
+        """Get basic info for all profiles (cached; callers must not modify it)"""
+        if self._basic_info_cache is None:
+            self._basic_info_cache = {profile_name: profile_info.basic_info
+                                      for profile_name, profile_info in self.profiles.items()}
+        return self._basic_info_cache
 
+    @_locked
     def clear_current_profile(self):
         """Clear current profile to ensure clean state"""
         self.current_profile = None
-        print("🧹 Cleared current profile")
+        self.version += 1
+        log.debug("🧹 Cleared current profile")
 
+    @_locked
     def get_profile_gestures_only(self, profile_name: str):
         """Get only the gestures for a specific profile (for debugging)"""
-        if profile_name in self.profiles:
-            profile_data = self.profiles[profile_name]['data']
+        profile_data = self.get_profile_data(profile_name)
+        if profile_data:
             gestures = profile_data.get('gestures', {})
             bindings = profile_data.get('bindings', {})
             active = profile_data.get('active_gestures', [])
 
-            print(f"🔍 Profile '{profile_name}' debug info:")
-            print(f"   Gestures: {list(gestures.keys())}")
-            print(f"   Bindings: {bindings}")
-            print(f"   Active: {active}")
+            log.debug("🔍 Profile '%s' debug info:", profile_name)
+            log.debug("   Gestures: %s", list(gestures))
+            log.debug("   Bindings: %s", bindings)
+            log.debug("   Active: %s", active)
 
             return {
                 'gestures': gestures,
@@ -10,6 +10,8 @@ import threading
 from collections import deque
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
 try:
     import pynput
     from pynput import keyboard
@@ -42,6 +44,21 @@ class GestureRecognitionEngine:
         self.last_executed_gesture = None
         self.last_execution_time = 0
         self.execution_cooldown = 1.0  # 1 second cooldown between same gesture executions
+
+        # Exact-match index of packed custom patterns and the profile version it was built from
+        self._pattern_index = {}
+        self._pattern_index_version = None
+
+        # Best built-in gesture (name, score) per discretized pattern; there are only 3**5 such patterns
+        self._builtin_match_cache = {}
+
+        # Best custom gesture (name, score) per (pattern, hand type), and the candidate names and
+        # pattern matrix per (hand type, pattern length), for the profile version they were built from.
+        # Callers pass GestureProfileManager.version, which changes on every profile edit; with no
+        # version (None) nothing is reused between calls
+        self._custom_match_cache = {}
+        self._custom_candidates = {}
+        self._custom_match_version = None
         
         # Known gesture patterns
         self.gesture_patterns = {
@@ -61,6 +78,10 @@ class GestureRecognitionEngine:
             'spock': {'fingers': [1, 1, 1, 0, 0], 'description': 'Vulcan salute'},
             'love': {'fingers': [0, 1, 0, 1, 1], 'description': 'I love you'},
         }
+
+        # Built-in patterns stacked once into an int8 matrix for scoring them all in one pass
+        self._pattern_names = list(self.gesture_patterns)
+        self._pattern_matrix = np.array([g['fingers'] for g in self.gesture_patterns.values()], dtype=np.int8)
     
     def calculate_distance(self, point1, point2):
         """Calculate distance between two points"""
@@ -68,15 +89,18 @@ class GestureRecognitionEngine:
     
     def calculate_angle(self, point1, point2, point3):
         """Calculate angle between three points"""
-        a = math.sqrt((point2[0] - point3[0])**2 + (point2[1] - point3[1])**2)
-        b = math.sqrt((point1[0] - point3[0])**2 + (point1[1] - point3[1])**2)
-        c = math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
-        
-        try:
-            angle = math.acos((a**2 + c**2 - b**2) / (2 * a * c))
-            return math.degrees(angle)
-        except:
+        return self._joint_angle(point1, point2, point3)
+
+    @staticmethod
+    def _joint_angle(point1, vertex, point3):
+        """Angle in degrees at vertex between point1 and point3 (clamped, so collinear points give 180; 0 if two coincide)"""
+        to_1_x, to_1_y = point1[0] - vertex[0], point1[1] - vertex[1]
+        to_3_x, to_3_y = point3[0] - vertex[0], point3[1] - vertex[1]
+        lengths = math.hypot(to_1_x, to_1_y) * math.hypot(to_3_x, to_3_y)
+        if lengths == 0:
             return 0
+        cosine = (to_1_x * to_3_x + to_1_y * to_3_y) / lengths
+        return math.degrees(math.acos(max(-1.0, min(1.0, cosine))))
     
     def calculate_hand_rotation(self, landmarks):
         """Calculate hand rotation using multiple reference points"""
@@ -101,21 +125,36 @@ class GestureRecognitionEngine:
     
     def analyze_finger_state(self, landmarks, finger_idx, hand_label="Unknown"):
         """Analyze individual finger state with detailed information"""
-        tip_idx = self.finger_tips[finger_idx]
-        pip_idx = self.finger_pips[finger_idx]
-        mcp_idx = self.finger_mcps[finger_idx]
+        tip = landmarks[self.finger_tips[finger_idx]]
+        pip = landmarks[self.finger_pips[finger_idx]]
+        mcp = landmarks[self.finger_mcps[finger_idx]]
+        wrist_x, wrist_y = landmarks[0][0], landmarks[0][1]
 
-        tip = landmarks[tip_idx]
-        pip = landmarks[pip_idx]
-        mcp = landmarks[mcp_idx]
-        wrist = landmarks[0]
+        tip_to_wrist = math.hypot(tip[0] - wrist_x, tip[1] - wrist_y)
+        pip_to_wrist = math.hypot(pip[0] - wrist_x, pip[1] - wrist_y)
+        mcp_to_wrist = math.hypot(mcp[0] - wrist_x, mcp[1] - wrist_y)
 
-        tip_to_wrist = self.calculate_distance(tip, wrist)
-        pip_to_wrist = self.calculate_distance(pip, wrist)
-        mcp_to_wrist = self.calculate_distance(mcp, wrist)
+        finger_angle = self._joint_angle(mcp, pip, tip)
 
-        finger_angle = self.calculate_angle(mcp, pip, tip)
+        state, description = self._classify_finger(finger_idx, tip, pip, tip_to_wrist, pip_to_wrist,
+                                                   mcp_to_wrist, hand_label)
 
+        return {
+            'state': state,
+            'description': description,
+            'angle': finger_angle,
+            'tip_distance': tip_to_wrist,
+            'pip_distance': pip_to_wrist,
+            'mcp_distance': mcp_to_wrist
+        }
+
+    def analyze_fingers(self, landmarks, hand_label="Unknown"):
+        """Analyze all five fingers of a hand"""
+        return [self.analyze_finger_state(landmarks, finger_idx, hand_label) for finger_idx in range(len(self.finger_tips))]
+
+    @staticmethod
+    def _classify_finger(finger_idx, tip, pip, tip_to_wrist, pip_to_wrist, mcp_to_wrist, hand_label):
+        """Get (state, description) for one finger from its tip/PIP positions and joint distances to the wrist"""
         if finger_idx == 0:  # Thumb special case - hand-aware detection
             # Calculate thumb extension based on hand orientation
             thumb_extension = tip[0] - pip[0]
@@ -161,24 +200,17 @@ class GestureRecognitionEngine:
                     state = -0.5
                     description = "Partially Bent"
 
-        return {
-            'state': state,
-            'description': description,
-            'angle': finger_angle,
-            'tip_distance': tip_to_wrist,
-            'pip_distance': pip_to_wrist,
-            'mcp_distance': mcp_to_wrist
-        }
+        return state, description
     
     def analyze_finger_spacing(self, landmarks):
         """Analyze spacing between fingers"""
         spacings = []
         finger_names = ['Thumb-Index', 'Index-Middle', 'Middle-Ring', 'Ring-Pinky']
+
+        tips = [landmarks[tip_idx] for tip_idx in self.finger_tips]
         
         for i in range(4):
-            tip1 = landmarks[self.finger_tips[i]]
-            tip2 = landmarks[self.finger_tips[i + 1]]
-            distance = self.calculate_distance(tip1, tip2)
+            distance = math.hypot(tips[i][0] - tips[i + 1][0], tips[i][1] - tips[i + 1][1])
             
             normalized_spacing = min(distance / 0.3, 1.0)
             
@@ -191,29 +223,29 @@ class GestureRecognitionEngine:
         
         return spacings
     
-    def recognize_gesture(self, finger_states, custom_gestures=None, active_gestures=None, hand_type='single'):
+    def recognize_gesture(self, finger_states, custom_gestures=None, active_gestures=None, hand_type='single',
+                          profile_version=None):
         """Recognize complex gestures from finger states"""
         pattern = [1 if state > 0.5 else -1 if state < -0.5 else 0 for state in finger_states]
 
-        # Check against known patterns first
-        best_match = None
-        best_score = 0
+        # Check against known patterns first; a held gesture repeats the same pattern frame after frame
+        pattern_key = tuple(pattern)
+        cached = self._builtin_match_cache.get(pattern_key)
+        if cached is None:
+            scores = self.score_patterns(self._pattern_matrix, pattern)
+            best_index = int(np.argmax(scores))
+            best_score = float(scores[best_index])
+            best_match = self._pattern_names[best_index] if best_score > 0 else None
+            if best_match is None:
+                best_score = 0
 
-        for gesture_name, gesture_info in self.gesture_patterns.items():
-            score = 0
-            for i, expected in enumerate(gesture_info['fingers']):
-                if pattern[i] == expected:
-                    score += 1
-                elif abs(pattern[i] - expected) <= 1:
-                    score += 0.5
-
-            if score > best_score:
-                best_score = score
-                best_match = gesture_name
+            cached = self._builtin_match_cache[pattern_key] = (best_match, best_score)
+        best_match, best_score = cached
 
         # Check against custom gestures
         if custom_gestures and active_gestures:
-            custom_match = self.match_custom_gesture(pattern, custom_gestures, active_gestures, hand_type)
+            custom_match = self.match_custom_gesture(pattern, custom_gestures, active_gestures, hand_type,
+                                                     profile_version)
             if custom_match and custom_match['confidence'] > best_score / 5.0:
                 return custom_match
 
@@ -227,7 +259,8 @@ class GestureRecognitionEngine:
             'is_custom': False
         }
 
-    def recognize_both_hands_gesture(self, left_finger_states, right_finger_states, custom_gestures=None, active_gestures=None):
+    def recognize_both_hands_gesture(self, left_finger_states, right_finger_states, custom_gestures=None, active_gestures=None,
+                                     profile_version=None):
         """Recognize gestures using both hands combined"""
         if not left_finger_states or not right_finger_states:
             return None
@@ -244,39 +277,16 @@ class GestureRecognitionEngine:
 
         # Check against custom both-hand gestures
         if custom_gestures and active_gestures:
-            best_match = None
-            best_score = 0
+            best_match, best_score = self.get_custom_match(combined_pattern, custom_gestures, active_gestures, 'both',
+                                                           profile_version)
+            gesture_data = custom_gestures.get(best_match) if best_match else None
 
-            for gesture_name, gesture_data in custom_gestures.items():
-                if gesture_name not in active_gestures:
-                    continue
-
-                if gesture_data.get('hand_type', 'single') != 'both':
-                    continue
-
-                stored_pattern = gesture_data.get('pattern', [])
-                if len(stored_pattern) != len(combined_pattern):
-                    continue
-
-                # Calculate similarity
-                score = 0
-                for i, (expected, actual) in enumerate(zip(stored_pattern, combined_pattern)):
-                    if expected == actual:
-                        score += 1
-                    elif abs(expected - actual) <= 1:
-                        score += 0.5
-
-                confidence = score / len(combined_pattern)
-                if confidence > best_score and confidence > 0.7:
-                    best_score = confidence
-                    best_match = gesture_name
-
-            if best_match:
+            if gesture_data is not None:
                 return {
                     'gesture': best_match,
                     'confidence': best_score,
                     'pattern': combined_pattern,
-                    'description': f'Both hands: {custom_gestures[best_match].get("description", "Custom gesture")}',
+                    'description': f'Both hands: {gesture_data.get("description", "Custom gesture")}',
                     'is_custom': True,
                     'hand_type': 'both',
                     'total_fingers': total_fingers
@@ -284,42 +294,115 @@ class GestureRecognitionEngine:
 
         return None
     
-    def match_custom_gesture(self, pattern, custom_gestures, active_gestures, hand_type='single'):
-        """Match against custom recorded gestures"""
-        best_match = None
-        best_score = 0
-
-
-
-        for gesture_name, gesture_data in custom_gestures.items():
-            if gesture_name not in active_gestures:
-                continue
+    @staticmethod
+    def pack_pattern(pattern):
+        """Pack a finger pattern into one int: extended fingers in the low bits, bent-inward fingers above them"""
+        packed = 0
+        for i, state in enumerate(pattern):
+            if state > 0:
+                packed |= 1 << i
+            elif state < 0:
+                packed |= 1 << (i + len(pattern))
+        return packed
+
+    def get_pattern_index(self, custom_gestures, active_gestures, profile_version=None):
+        """Map packed single-hand patterns to the first active gesture using them (rebuilt when the profile version changes)"""
+        if profile_version is None or profile_version != self._pattern_index_version:
+            index = {}
+            for gesture_name, gesture_data in custom_gestures.items():
+                pattern = gesture_data.get('pattern', [])
+                if (gesture_name in active_gestures
+                        and gesture_data.get('hand_type', 'single') == 'single'
+                        and len(pattern) == len(self.finger_tips)
+                        and all(state in (-1, 0, 1) for state in pattern)):
+                    index.setdefault(self.pack_pattern(pattern), gesture_name)
+
+            self._pattern_index = index
+            self._pattern_index_version = profile_version
+        return self._pattern_index
+
+    @staticmethod
+    def score_patterns(pattern_matrix, pattern):
+        """Score every row of a pattern matrix against a pattern: a full point per equal finger, half when off by one"""
+        diff = np.abs(pattern_matrix - np.array(pattern, dtype=np.int8))
+        return (diff == 0).sum(axis=1) + 0.5 * (diff == 1).sum(axis=1)
+
+    def _check_custom_version(self, profile_version):
+        """Drop cached custom matches and candidate matrices unless they were built for this profile version"""
+        if profile_version is None or profile_version != self._custom_match_version:
+            self._custom_match_cache = {}
+            self._custom_candidates = {}
+            self._custom_match_version = profile_version
+
+    def find_best_pattern_match(self, pattern, custom_gestures, active_gestures, hand_type='single', profile_version=None):
+        """Score all candidate gestures against a pattern in one vectorized pass"""
+        self._check_custom_version(profile_version)
+
+        # Candidate names and their stacked patterns are built once per (hand type, length)
+        candidates_key = (hand_type, len(pattern))
+        if candidates_key not in self._custom_candidates:
+            candidates = [gesture_name for gesture_name, gesture_data in custom_gestures.items()
+                          if gesture_name in active_gestures
+                          and gesture_data.get('hand_type', 'single') == hand_type
+                          and len(gesture_data.get('pattern', [])) == len(pattern)]
+            stored_patterns = (np.array([custom_gestures[name]['pattern'] for name in candidates], dtype=np.int8)
+                               if candidates else None)
+            self._custom_candidates[candidates_key] = (candidates, stored_patterns)
+
+        candidates, stored_patterns = self._custom_candidates[candidates_key]
+        if not candidates:
+            return None, 0
+
+        scores = self.score_patterns(stored_patterns, pattern)
+        best_index = int(np.argmax(scores))
+        best_score = float(scores[best_index]) / len(pattern)
+
+        if best_score > 0.7:
+            return candidates[best_index], best_score
+        return None, 0
+
+    def get_custom_match(self, pattern, custom_gestures, active_gestures, hand_type='single', profile_version=None):
+        """Get the best custom gesture (name, score) for a pattern, cached until the profile version changes"""
+        self._check_custom_version(profile_version)
+
+        key = (tuple(pattern), hand_type)
+        cached = self._custom_match_cache.get(key)
+        if (cached is not None and cached[0] is not None
+                and (cached[0] not in custom_gestures or cached[0] not in active_gestures)):
+            # The profile was edited in place without a version change; rebuild from what it holds now
+            self._check_custom_version(None)
+            self._pattern_index_version = None
+            cached = None
+
+        if cached is None:
+            best_match = None
 
-            if gesture_data.get('hand_type', 'single') != hand_type:
-                continue
+            # Exact single-hand matches resolve with one lookup; anything else falls back to scoring
+            if hand_type == 'single' and len(pattern) == len(self.finger_tips):
+                pattern_index = self.get_pattern_index(custom_gestures, active_gestures, profile_version)
+                best_match = pattern_index.get(self.pack_pattern(pattern))
+                best_score = 1.0
 
-            stored_pattern = gesture_data.get('pattern', [])
-            if len(stored_pattern) != len(pattern):
-                continue
+            if not best_match:
+                best_match, best_score = self.find_best_pattern_match(
+                    pattern, custom_gestures, active_gestures, hand_type, profile_version
+                )
 
-            score = 0
-            for i, (expected, actual) in enumerate(zip(stored_pattern, pattern)):
-                if expected == actual:
-                    score += 1
-                elif abs(expected - actual) <= 1:
-                    score += 0.5
+            cached = self._custom_match_cache[key] = (best_match, best_score)
+        return cached
 
-            confidence = score / len(pattern)
-            if confidence > best_score and confidence > 0.7:
-                best_score = confidence
-                best_match = gesture_name
+    def match_custom_gesture(self, pattern, custom_gestures, active_gestures, hand_type='single', profile_version=None):
+        """Match against custom recorded gestures"""
+        best_match, best_score = self.get_custom_match(pattern, custom_gestures, active_gestures, hand_type,
+                                                       profile_version)
+        gesture_data = custom_gestures.get(best_match) if best_match else None
 
-        if best_match:
+        if gesture_data is not None:
             return {
                 'gesture': best_match,
                 'confidence': best_score,
                 'pattern': pattern,
-                'description': custom_gestures[best_match].get('description', 'Custom gesture'),
+                'description': gesture_data.get('description', 'Custom gesture'),
                 'is_custom': True
             }
 
@@ -461,14 +544,11 @@ class GestureRecognitionEngine:
             except:
                 pass
     
-    def analyze_hand(self, landmarks, hand_label, custom_gestures=None, active_gestures=None, gesture_bindings=None):
+    def analyze_hand(self, landmarks, hand_label, custom_gestures=None, active_gestures=None, gesture_bindings=None,
+                     profile_version=None):
         """Analyze a single hand and return comprehensive data"""
-        finger_data = []
-        
-        # Analyze each finger with hand awareness
-        for i in range(5):
-            finger_info = self.analyze_finger_state(landmarks, i, hand_label)
-            finger_data.append(finger_info)
+        # Analyze every finger with hand awareness
+        finger_data = self.analyze_fingers(landmarks, hand_label)
         
         # Calculate hand rotation
         rotation = self.calculate_hand_rotation(landmarks)
@@ -478,7 +558,7 @@ class GestureRecognitionEngine:
         
         # Recognize gesture
         finger_states = [f['state'] for f in finger_data]
-        gesture = self.recognize_gesture(finger_states, custom_gestures, active_gestures)
+        gesture = self.recognize_gesture(finger_states, custom_gestures, active_gestures, profile_version=profile_version)
         
         # Execute gesture action if recognized
         if gesture['is_custom'] and gesture['confidence'] > 0.7 and gesture_bindings:
@@ -29,8 +29,8 @@ class GestureRecorder:
         """Set callback for status updates (message, color)"""
         self.status_callback = callback
     
-    def set_completion_callback(self, callback: Callable[[str, dict], None]):
-        """Set callback for recording completion (gesture_name, gesture_data)"""
+    def set_completion_callback(self, callback: Callable[[str, Optional[dict]], None]):
+        """Set callback for recording completion (gesture_name, gesture_data or None if nothing was saved)"""
         self.completion_callback = callback
     
     def start_recording_with_timer(self, gesture_name: str, key_binding: str, hand_type: str = 'single'):
@@ -110,6 +110,7 @@ class GestureRecorder:
                     self.status_callback(message, 'red')
                 except Exception as e:
                     print(f"Warning: Status callback error: {e}")
+            self._notify_completion(None)
             return False
 
         # Average the recorded patterns for stability
@@ -158,13 +159,17 @@ class GestureRecorder:
             except Exception as e:
                 print(f"Warning: Status callback error: {e}")
 
+        self._notify_completion(gesture_data)
+
+        return True
+
+    def _notify_completion(self, gesture_data: Optional[dict]):
+        """Tell the completion callback that recording ended (gesture_data is None on failure)"""
         if self.completion_callback:
             try:
                 self.completion_callback(self.recording_name, gesture_data)
             except Exception as e:
                 print(f"Warning: Completion callback error: {e}")
-
-        return True
     
     def cancel_recording(self):
         """Cancel current recording"""
@@ -181,6 +186,7 @@ class GestureRecorder:
                 self.status_callback(message, 'orange')
             except Exception as e:
                 print(f"Warning: Status callback error: {e}")
+        self._notify_completion(None)
     
     def is_recording(self):
         """Check if currently recording"""
@@ -244,8 +250,12 @@ class GestureRecordingSession:
         self.recorder.start_recording_with_timer(gesture_name, key_binding, hand_type)
         return True
     
-    def on_gesture_recorded(self, gesture_name: str, gesture_data: dict):
+    def on_gesture_recorded(self, gesture_name: str, gesture_data: Optional[dict]):
         """Handle completed gesture recording"""
+        if gesture_data is None:
+            # Recording failed or was cancelled, nothing to save
+            return
+
         self.recorded_gestures[gesture_name] = gesture_data
         
         # Save to current profile
@@ -12,7 +12,9 @@ Features:
 - GUI settings panel for easy management
 
 Usage:
-    python main.py
+    python main.py [--debug]
+
+Pass --debug to log every profile load, save and delete.
 
 Controls:
     - Press 's' to open Settings panel
@@ -21,6 +23,7 @@ Controls:
 
 import sys
 import os
+import logging
 import traceback
 
 # Add current directory to Python path for imports
@@ -32,6 +35,7 @@ try:
     
     def main():
         """Main entry point for the gesture recognition system"""
+        logging.basicConfig(level=logging.DEBUG if '--debug' in sys.argv else logging.INFO, format='%(message)s')
         print("🚀 Starting Enhanced Hand Gesture Recognition System...")
         print("=" * 60)
         
@@ -7,6 +7,7 @@ Integrates all components for comprehensive hand gesture recognition
 import cv2
 import mediapipe as mp
 import numpy as np
+import logging
 import traceback
 from collections import deque
 
@@ -135,7 +136,8 @@ class ComprehensiveHandGestureAnalyzer:
                     finger_states = [finger['state'] for finger in self.right_hand_data['fingers']]
                     self.gesture_recorder.add_recording_data(finger_states)
 
-    def analyze_both_hands_gesture(self, profile_data, custom_gestures, active_gestures, gesture_bindings):
+    def analyze_both_hands_gesture(self, profile_data, custom_gestures, active_gestures, gesture_bindings,
+                                   profile_version=None):
         """Analyze both hands together for combined gestures"""
         if not self.left_hand_data or not self.right_hand_data:
             return
@@ -145,7 +147,7 @@ class ComprehensiveHandGestureAnalyzer:
 
         # Recognize both-hand gesture
         both_hands_gesture = self.recognition_engine.recognize_both_hands_gesture(
-            left_finger_states, right_finger_states, custom_gestures, active_gestures
+            left_finger_states, right_finger_states, custom_gestures, active_gestures, profile_version
         )
 
         # Execute if recognized
@@ -266,11 +268,13 @@ class ComprehensiveHandGestureAnalyzer:
                         for lm in hand_landmarks.landmark:
                             landmarks.append([lm.x, lm.y])
                         
-                        # Get current profile data for gesture recognition
+                        # Get current profile data for gesture recognition (version read first, so an
+                        # edit made while this frame is analyzed shows up as a new version next frame)
+                        profile_version = self.profile_manager.version
                         profile_data = self.profile_manager.get_current_profile_data()
                         if profile_data:
                             custom_gestures = profile_data.get('gestures', {})
-                            active_gestures = set(profile_data.get('active_gestures', []))
+                            active_gestures = self.profile_manager.get_active_gestures()
                             gesture_bindings = profile_data.get('bindings', {})
 
                             # Debug: Occasionally show what profile is active (every 5 seconds)
@@ -284,12 +288,13 @@ class ComprehensiveHandGestureAnalyzer:
                                 print(f"🎯 Active Gestures: {list(active_gestures)}")
                         else:
                             custom_gestures = {}
-                            active_gestures = set()
+                            active_gestures = frozenset()
                             gesture_bindings = {}
                         
                         # Analyze hand
                         hand_data = self.recognition_engine.analyze_hand(
-                            landmarks, hand_label, custom_gestures, active_gestures, gesture_bindings
+                            landmarks, hand_label, custom_gestures, active_gestures, gesture_bindings,
+                            profile_version
                         )
                         
                         if hand_label == "Left":
@@ -310,7 +315,8 @@ class ComprehensiveHandGestureAnalyzer:
 
                 # Check for both-hand gestures if both hands are detected
                 if self.left_hand_data and self.right_hand_data:
-                    self.analyze_both_hands_gesture(profile_data, custom_gestures, active_gestures, gesture_bindings)
+                    self.analyze_both_hands_gesture(profile_data, custom_gestures, active_gestures, gesture_bindings,
+                                                    profile_version)
 
                 # Display information
                 self.display_info(frame)
@@ -351,6 +357,7 @@ class ComprehensiveHandGestureAnalyzer:
 
 # Main execution
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     try:
         analyzer = ComprehensiveHandGestureAnalyzer()
         analyzer.run()
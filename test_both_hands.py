@@ -106,9 +106,40 @@ try:
             print(f"Combined pattern: {combined_pattern}")
             print()
     
+    def test_gesture_removed_in_place():
+        """Test that a gesture deleted from the profile dict in place is not matched from the cache"""
+        print("\n🗑️  Testing gesture removed in place...")
+
+        engine = GestureRecognitionEngine()
+        custom_gestures = {
+            'six': {'pattern': [6, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1], 'hand_type': 'both'},
+            'one': {'pattern': [0, 1, 0, 0, 0], 'hand_type': 'single'}
+        }
+        active_gestures = {'six', 'one'}
+
+        # Same profile version for every call, as if the edit had not been saved yet
+        engine.recognize_both_hands_gesture([0, 1, 0, 0, 0], [1, 1, 1, 1, 1], custom_gestures, active_gestures, 1)
+        engine.match_custom_gesture([0, 1, 0, 0, 0], custom_gestures, active_gestures, profile_version=1)
+        del custom_gestures['six']
+        del custom_gestures['one']
+
+        try:
+            both = engine.recognize_both_hands_gesture([0, 1, 0, 0, 0], [1, 1, 1, 1, 1], custom_gestures,
+                                                       active_gestures, 1)
+            single = engine.match_custom_gesture([0, 1, 0, 0, 0], custom_gestures, active_gestures, profile_version=1)
+        except KeyError as e:
+            print(f"❌ Stale cached match raised KeyError: {e}")
+            return
+
+        if both is None and single is None:
+            print("✅ Removed gestures are no longer matched")
+        else:
+            print(f"❌ Removed gesture still matched: {both or single}")
+
     if __name__ == "__main__":
         test_both_hands_recognition()
         test_pattern_creation()
+        test_gesture_removed_in_place()
 
 except ImportError as e:
     print(f"❌ Import error: {e}")
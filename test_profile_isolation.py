@@ -11,6 +11,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
     from gesture_profile_manager import GestureProfileManager
+    from gesture_recognition import GestureRecognitionEngine
     
     def create_test_profiles_with_different_gestures():
         """Create test profiles with clearly different gestures"""
@@ -181,10 +182,65 @@ try:
         else:
             print("   ❌ Profile clearing failed")
     
+    def test_template_profile_isolation():
+        """Test that creating a template profile leaves the current profile untouched"""
+        print("\n🧪 Testing Template Profile Isolation...")
+        
+        manager = create_test_profiles_with_different_gestures()
+        manager.delete_profile("Racing Game")  # start from a fresh template
+        manager.load_profile("Numbers")
+        
+        if manager.create_template_profile("Racing Game"):
+            template_gestures = manager.get_template_gestures("Racing Game")
+            numbers_data = manager.get_current_profile_data()
+            print(f"Template gestures: {list(template_gestures.keys())}")
+            print(f"Current profile: {manager.current_profile}")
+            
+            if template_gestures and 'template_gestures' not in numbers_data and manager.current_profile == "Numbers":
+                print("   ✅ Template gestures stored on the template profile only")
+            else:
+                print("   ❌ Template gestures missing or written to the current profile")
+        else:
+            print("   ❌ Failed to create template profile")
+    
+    def test_in_place_edit_recognition():
+        """Test that a gesture edited in memory is recognized before the profile is saved"""
+        print("\n✏️  Testing in-place gesture edit...")
+
+        manager = create_test_profiles_with_different_gestures()
+        manager.load_profile("Numbers")
+        engine = GestureRecognitionEngine()
+
+        def recognize(pattern):
+            profile_data = manager.get_current_profile_data()
+            match = engine.match_custom_gesture(pattern, profile_data['gestures'], manager.get_active_gestures(),
+                                                profile_version=manager.version)
+            return match['gesture'] if match else None
+
+        before = recognize([0, 1, 0, 0, 0])
+
+        # Edit the gesture in place, the way the settings window does, and mark it without saving
+        manager.get_current_profile_data()['gestures']['one']['pattern'] = [1, 0, 0, 0, 1]
+        manager.mark_profile_changed("Numbers")
+
+        after_new = recognize([1, 0, 0, 0, 1])
+        after_old = recognize([0, 1, 0, 0, 0])
+        print(f"Before edit: {before}, edited pattern: {after_new}, old pattern: {after_old}")
+
+        if before == 'one' and after_new == 'one' and after_old != 'one':
+            print("   ✅ Edit recognized before saving")
+        else:
+            print("   ❌ Recognition did not follow the in-place edit")
+
+        # Drop the unsaved edit so the test profile keeps its gestures
+        manager.load_profile("Numbers")
+
     if __name__ == "__main__":
         test_profile_switching()
         test_profile_data_integrity()
         test_current_profile_tracking()
+        test_template_profile_isolation()
+        test_in_place_edit_recognition()
         
         print("\n🎉 Profile isolation testing completed!")
         print("Each profile should now contain only its own gestures.")